@@ -2,17 +2,532 @@
 Animation Functions for Image Morphing
 """
 
+import queue
+import threading
+import time
+import traceback
 from tkinter import messagebox
-from morph_algorithm import warp_image_with_lines, interpolate_lines, blend_images, generate_grid, warp_grid_points
-from ui_helpers import display_image_on_canvas, scale_lines_to_image, display_image_with_grid_overlay
+import numpy as np
+from morph_algorithm import (warp_image_with_lines, warp_pair_with_shared_dest, interpolate_lines_batch, blend_images,
+                             generate_grid, warp_grid_pair_with_shared_dest)
+from ui_helpers import (display_image_on_canvas, scale_lines_to_image, display_image_with_grid_overlay,
+                        photo_for_canvas, show_photo_on_canvas)
 from PIL import Image
 
 
+# Precomputed animation frames, keyed by the inputs that determine them.
+# Each entry also holds the source images so their id() cannot be reused.
+_frame_cache = {}
+_FRAME_CACHE_SIZE = 4
+
+# Single warps shared between runs and between the two animation modes, keyed
+# by the source image and both line sets. Filled from the precompute threads.
+_warp_cache = {}
+_WARP_CACHE_SIZE = 32
+_warp_cache_lock = threading.Lock()
+
+# Source images resized to a warp size, keyed by (id(original), size), so
+# redrawing lines or restarting an animation does not resize them again.
+# Each entry also holds the original so its id() cannot be reused.
+_resized_cache = {}
+_RESIZED_CACHE_SIZE = 6
+_resized_cache_lock = threading.Lock()
+
+# How often the Tk thread checks on background frame computation (milliseconds)
+_POLL_INTERVAL = 50
+
+
+def _get_cached_frames(key):
+    """
+    Look up previously computed animation frames.
+    
+    Args:
+        key: Hashable key describing the animation inputs
+    
+    Returns:
+        The cached frames, or None if not cached
+    """
+    entry = _frame_cache.get(key)
+    if entry is None:
+        return None
+    return entry[1]
+
+
+def _store_cached_frames(key, source_images, frames):
+    """
+    Store computed animation frames, evicting the oldest entry when full.
+    
+    Args:
+        key: Hashable key describing the animation inputs
+        source_images: Tuple of source PIL Images the frames were built from
+        frames: Precomputed frames, in the form the animation stored them
+    """
+    if key not in _frame_cache and len(_frame_cache) >= _FRAME_CACHE_SIZE:
+        del _frame_cache[next(iter(_frame_cache))]
+    _frame_cache[key] = (source_images, frames)
+
+
+def _delay_until(target_time):
+    """
+    Milliseconds from now until target_time, for root.after().
+    
+    Args:
+        target_time: time.monotonic() value to wait for
+    
+    Returns:
+        Non-negative delay in milliseconds
+    """
+    return max(0, int((target_time - time.monotonic()) * 1000))
+
+
+def _is_identity_warp(src_lines, dst_lines):
+    """Whether warping from src_lines to dst_lines leaves the image unchanged."""
+    return np.array_equal(np.asarray(dst_lines, dtype=np.float64), src_lines)
+
+
+def _warp_or_copy(image, src_lines, dst_lines):
+    """
+    Warp an image, copying it instead when the warp is the identity.
+    
+    Args:
+        image: PIL Image to warp
+        src_lines: Feature lines in image, (N, 2, 2) array
+        dst_lines: Destination feature lines
+    
+    Returns:
+        Warped PIL Image
+    """
+    if _is_identity_warp(src_lines, dst_lines):
+        return image.copy()
+    return warp_image_with_lines(image, src_lines, dst_lines, a=0.01, b=2.0, p=0.0)
+
+
+def _warp_cache_key(image, original, src_lines, dst_lines):
+    """
+    Build the _warp_cache key for warping image from src_lines to dst_lines.
+    
+    Args:
+        image: PIL Image to warp (original, possibly resized to the target size)
+        original: User-loaded PIL Image that image was derived from
+        src_lines: Feature lines in image
+        dst_lines: Destination feature lines
+    
+    Returns:
+        Hashable key
+    """
+    return (id(original), image.size,
+            np.asarray(src_lines, dtype=np.float64).tobytes(),
+            np.asarray(dst_lines, dtype=np.float64).tobytes())
+
+
+def _remember_warp(key, original, warped):
+    """
+    Store a warp result, evicting the oldest entry when full.
+    
+    Args:
+        key: Key from _warp_cache_key
+        original: User-loaded PIL Image the warp was derived from
+        warped: Warped PIL Image
+    """
+    with _warp_cache_lock:
+        if key not in _warp_cache and len(_warp_cache) >= _WARP_CACHE_SIZE:
+            del _warp_cache[next(iter(_warp_cache))]
+        # Holding the original keeps its id() from being reused
+        _warp_cache[key] = (original, warped)
+
+
+def _compute_frame(images, grid_lines, job):
+    """
+    Warp both images (and the grid) of one animation frame.
+    
+    Args:
+        images: Tuple of source PIL Images, indexed by the job
+        grid_lines: Grid lines to warp, or None
+        job: (index_a, lines_a, index_b, lines_b, lines_interp), morphing
+             source image index_a into index_b at the interpolated lines;
+             an index is None when that warp is already cached and should
+             be skipped
+    
+    Returns:
+        Tuple: (warped_a, warped_b, warped_grid_a, warped_grid_b), with None
+        for skipped warps and for grids when no grid is shown
+    """
+    index_a, lines_a, index_b, lines_b, lines_interp = job
+    
+    warped_a = None
+    warped_b = None
+    if (index_a is not None and index_b is not None and
+            not _is_identity_warp(lines_a, lines_interp) and not _is_identity_warp(lines_b, lines_interp)):
+        # Both warps share the interpolated lines, so share their destination terms
+        warped_a, warped_b = warp_pair_with_shared_dest(images[index_a], images[index_b],
+                                                        lines_a, lines_b, lines_interp,
+                                                        a=0.01, b=2.0, p=0.0)
+    else:
+        if index_a is not None:
+            warped_a = _warp_or_copy(images[index_a], lines_a, lines_interp)
+        if index_b is not None:
+            warped_b = _warp_or_copy(images[index_b], lines_b, lines_interp)
+    
+    # Warp grids if grid visualization is enabled
+    warped_grid_a = None
+    warped_grid_b = None
+    if grid_lines is not None:
+        warped_grid_a, warped_grid_b = warp_grid_pair_with_shared_dest(
+            grid_lines, lines_a, lines_b, lines_interp,
+            a=0.01, b=2.0, p=0.0, samples_per_line=20)
+    
+    return warped_a, warped_b, warped_grid_a, warped_grid_b
+
+
+def _compute_frames(images, originals, grid_lines, jobs, cancel_event):
+    """
+    Compute animation frames one after another, yielding them in job order.
+    
+    Frames are warped at canvas size and each warp already spreads its row
+    bands over the warp thread pool, so frames are computed in this thread
+    rather than in worker processes, whose start-up would cost more than
+    the frames themselves. Warps found in _warp_cache are not recomputed,
+    and new warps are added to it. Stops early once cancel_event is set.
+    
+    Args:
+        images: Tuple of source PIL Images, all at the warp size
+        originals: User-loaded PIL Images the sources were derived from
+        grid_lines: Grid lines to warp, or None
+        jobs: List of (index_a, lines_a, index_b, lines_b, lines_interp); see _compute_frame
+        cancel_event: threading.Event set when the animation is stopped
+    
+    Yields:
+        Tuple: (warped_a, warped_b, warped_grid_a, warped_grid_b) per job
+    """
+    for index_a, lines_a, index_b, lines_b, lines_interp in jobs:
+        if cancel_event.is_set():
+            return
+        
+        # Look up cached warps first so only the missing ones are computed
+        slots = []
+        for index, lines in ((index_a, lines_a), (index_b, lines_b)):
+            key = _warp_cache_key(images[index], originals[index], lines, lines_interp)
+            with _warp_cache_lock:
+                entry = _warp_cache.get(key)
+            slots.append((index, key, entry[1] if entry is not None else None))
+        (_, _, cached_a), (_, _, cached_b) = slots
+        
+        result = _compute_frame(images, grid_lines,
+                                (None if cached_a is not None else index_a, lines_a,
+                                 None if cached_b is not None else index_b, lines_b, lines_interp))
+        
+        warped = list(result[:2])
+        for i, (index, key, cached) in enumerate(slots):
+            if cached is not None:
+                warped[i] = cached
+            else:
+                _remember_warp(key, originals[index], warped[i])
+        
+        yield warped[0], warped[1], result[2], result[3]
+
+
+def _sequential_frame_jobs(line_sets, alpha_steps):
+    """
+    Build the frame jobs of a sequential 1→2→3 animation.
+    
+    The 2→3 frame at alpha=0 would duplicate the last 1→2 frame, so the
+    second transition starts at alpha_steps[1].
+    
+    Args:
+        line_sets: (lines1, lines2, lines3) at the warp size
+        alpha_steps: Alpha values of one transition, from 0 to 1
+    
+    Returns:
+        Tuple: (alphas, jobs), the blend alpha of every frame and its job
+        (see _compute_frame), 1→2 frames first
+    """
+    lines1, lines2, lines3 = line_sets
+    lines_interp_12 = interpolate_lines_batch(lines1, lines2, alpha_steps)
+    lines_interp_23 = interpolate_lines_batch(lines2, lines3, alpha_steps[1:])
+    
+    alphas = np.concatenate([alpha_steps, alpha_steps[1:]])
+    jobs = ([(0, lines1, 1, lines2, lines_interp) for lines_interp in lines_interp_12] +
+            [(1, lines2, 2, lines3, lines_interp) for lines_interp in lines_interp_23])
+    return alphas, jobs
+
+
+def _warp_size(image, canvas_width, canvas_height):
+    """
+    Choose the resolution animation frames are warped at.
+    
+    Frames are only ever shown resized to the canvas, so images larger than
+    the canvas are warped at canvas size instead of their own size.
+    
+    Args:
+        image: First source PIL Image (the one others are resized to)
+        canvas_width: Width of canvas
+        canvas_height: Height of canvas
+    
+    Returns:
+        (width, height) to warp at
+    """
+    if image.size[0] * image.size[1] > canvas_width * canvas_height:
+        return (canvas_width, canvas_height)
+    return image.size
+
+
+def _resample_filter(source_size, target_size):
+    """
+    Pick the resampling filter for resizing source_size to target_size.
+    
+    LANCZOS only pays off for large scale changes; within a factor of two
+    BILINEAR looks the same after warping and display, and is much cheaper.
+    
+    Args:
+        source_size: (width, height) of the image being resized
+        target_size: (width, height) to resize to
+    
+    Returns:
+        Image.Resampling filter
+    """
+    ratio = target_size[0] / source_size[0]
+    if 0.5 <= ratio <= 2.0:
+        return Image.Resampling.BILINEAR
+    return Image.Resampling.LANCZOS
+
+
+def _resize_to_target(image, target_size):
+    """
+    Resize an image to target_size (see _resample_filter for the filter used).
+    
+    JPEG sources are first decoded at a reduced scale with draft(), which is
+    much cheaper than decoding at full resolution and downsampling. draft()
+    only works before pixel data is loaded, so the file is reopened for it.
+    
+    Args:
+        image: PIL Image to resize
+        target_size: (width, height) to resize to
+    
+    Returns:
+        Resized PIL Image
+    """
+    if image.format == "JPEG" and getattr(image, "filename", ""):
+        try:
+            source = Image.open(image.filename)
+            source.draft(image.mode, target_size)
+            return source.resize(target_size, _resample_filter(source.size, target_size),
+                                 reducing_gap=2.0)
+        except OSError:
+            pass  # File moved or unreadable; fall back to the loaded image
+    
+    return image.resize(target_size, _resample_filter(image.size, target_size), reducing_gap=2.0)
+
+
+def _frame_photo(photo_cache, key, image, canvas_width, canvas_height, warped_grid=None, grid_color="cyan"):
+    """
+    Get the PhotoImage for one frame image, building it on first use.
+    
+    The grid overlay is drawn into the PhotoImage, so ping-pong replay of a
+    frame only swaps the image shown on the canvas.
+    
+    Args:
+        photo_cache: Dict of PhotoImages owned by the running animation
+        key: Cache key identifying this frame image, e.g. (frame_index, slot)
+        image: PIL Image or uint8 array to display
+        canvas_width: Width of canvas
+        canvas_height: Height of canvas
+        warped_grid: Optional warped grid lines to overlay
+        grid_color: Color of grid lines
+    
+    Returns:
+        ImageTk.PhotoImage
+    """
+    photo = photo_cache.get(key)
+    if photo is None:
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        photo = photo_for_canvas(image, canvas_width, canvas_height, warped_grid, grid_color)
+        photo_cache[key] = photo
+    return photo
+
+
+def _cached_resize(original, target_size):
+    """
+    Resize a user-loaded image to target_size, reusing earlier results.
+    
+    Args:
+        original: User-loaded PIL Image
+        target_size: (width, height) to resize to
+    
+    Returns:
+        Resized PIL Image, or original itself when it already has target_size
+        (shared either way; callers must not modify it)
+    """
+    # Already the right size (e.g. Image 1 when it is no larger than the canvas)
+    if original.size == target_size:
+        return original
+    
+    key = (id(original), target_size)
+    with _resized_cache_lock:
+        entry = _resized_cache.get(key)
+    if entry is not None:
+        return entry[1]
+    
+    resized = _resize_to_target(original, target_size)
+    with _resized_cache_lock:
+        if key not in _resized_cache and len(_resized_cache) >= _RESIZED_CACHE_SIZE:
+            del _resized_cache[next(iter(_resized_cache))]
+        _resized_cache[key] = (original, resized)
+    return resized
+
+
+def grid_for_warp(original, target_size):
+    """
+    Generate the preview grid for warping original at target_size.
+    
+    The grid lines stay 30 pixels of the original apart, the spacing they
+    had when images were warped at full size, so warping at display
+    resolution does not coarsen the grid.
+    
+    Args:
+        original: User-loaded PIL Image that sets the warp size
+        target_size: (width, height) the image is warped at
+    
+    Returns:
+        Grid lines in target coordinates (see generate_grid)
+    """
+    spacing = 30 * target_size[0] / original.size[0]
+    return generate_grid(target_size[0], target_size[1], grid_spacing=spacing)
+
+
+def prepare_warp_sources(originals, line_sets, canvas_width, canvas_height, show_grid):
+    """
+    Resize the source images for warping and scale their lines to match.
+    
+    Args:
+        originals: Tuple of user-loaded PIL Images; the first sets the warp size
+        line_sets: Canvas-coordinate lines for each image
+        canvas_width: Width of canvas
+        canvas_height: Height of canvas
+        show_grid: Whether to generate the grid to warp
+    
+    Returns:
+        Tuple: (resized_images, scaled_line_sets, grid_lines), with grid_lines
+        None when no grid is shown
+    """
+    # Warp at display resolution; all images share that size
+    target_size = _warp_size(originals[0], canvas_width, canvas_height)
+    resized = tuple(_cached_resize(image, target_size) for image in originals)
+    
+    # Scale lines straight to target coordinates (canvas -> image -> target
+    # composes to canvas -> target, so resized images need no second pass)
+    scaled = tuple(scale_lines_to_image(lines, canvas_width, canvas_height,
+                                        target_size[0], target_size[1])
+                   for lines in line_sets)
+    
+    grid_lines = None
+    if show_grid:
+        grid_lines = grid_for_warp(originals[0], target_size)
+    
+    return resized, scaled, grid_lines
+
+
+def _advance_ping_pong(current_frame, direction, frame_count, all_frames_ready):
+    """
+    Step a ping-pong playback position.
+    
+    Playback only turns around at the end once every frame exists; until
+    then it keeps moving forward (and waits for frames that are not ready).
+    
+    Args:
+        current_frame: Index of the frame just shown
+        direction: 1 for forward, -1 for backward
+        frame_count: Number of frames available so far
+        all_frames_ready: Whether frame_count is final
+    
+    Returns:
+        Tuple: (next_frame, direction)
+    """
+    current_frame += direction
+    if all_frames_ready and current_frame >= frame_count:
+        return frame_count - 2, -1
+    if current_frame < 0:
+        return 1, 1
+    return current_frame, direction
+
+
+def _run_in_background(root, status_label, compute, on_item, on_done, cancel_event, error_message):
+    """
+    Run compute on a worker thread while the Tk event loop keeps running.
+    
+    The worker never touches Tk. It posts status text and each finished item
+    to a queue that the Tk thread drains every _POLL_INTERVAL ms, so items can
+    be consumed (e.g. played back) while later ones are still being computed.
+    
+    Args:
+        root: Tk root window
+        status_label: Label that shows progress messages
+        compute: Function compute(report, emit) run on the worker thread;
+                 report(text) posts a status message, emit(item) posts a result
+        on_item: Called on the Tk thread with each emitted item, in order
+        on_done: Called on the Tk thread once compute has finished
+        cancel_event: threading.Event; once set, remaining items are discarded
+        error_message: Prefix for the error dialog if compute raises
+    """
+    messages = queue.Queue()
+    items_received = False
+    
+    def worker():
+        try:
+            compute(lambda text: messages.put(("status", text)),
+                    lambda item: messages.put(("item", item)))
+            messages.put(("done", None))
+        except Exception as e:
+            traceback.print_exc()
+            messages.put(("error", e))
+    
+    def poll():
+        nonlocal items_received
+        while True:
+            try:
+                kind, value = messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            if cancel_event.is_set():
+                if not items_received:
+                    status_label.config(text="Animation stopped")
+                return
+            
+            if kind == "status":
+                # Once playback has started it owns the status label
+                if not items_received:
+                    status_label.config(text=value)
+            elif kind == "item":
+                items_received = True
+                on_item(value)
+            elif kind == "done":
+                on_done()
+                return
+            else:
+                # Stop any playback that is waiting on frames that will never come
+                cancel_event.set()
+                messagebox.showerror("Error", f"{error_message}: {str(value)}")
+                status_label.config(text=f"{error_message} - see error message")
+                return
+        
+        root.after(_POLL_INTERVAL, poll)
+    
+    threading.Thread(target=worker, daemon=True).start()
+    root.after(_POLL_INTERVAL, poll)
+
+
 def create_warp_animation(root, status_label, output1_canvas, output2_canvas, output3_canvas, output4_canvas,
                           image1_original, image2_original, lines_image1, lines_image2,
-                          is_three_image_mode, canvas_width, canvas_height, show_grid=False):
+                          is_three_image_mode, canvas_width, canvas_height, show_grid=False,
+                          keep_intermediate=True):
     """
     Generate and display ping-pong animation for 2-image morphing.
+    
+    The warp pair of every frame is kept so the Image 1/2 canvases animate
+    along with the blend. With keep_intermediate=False only the blended
+    frames are kept; the Image 1/2 canvases then show each warp pair as it
+    is computed and end on the last one.
     """
     try:
         if is_three_image_mode:
@@ -31,130 +546,180 @@ def create_warp_animation(root, status_label, output1_canvas, output2_canvas, ou
             messagebox.showerror("Error", "Number of lines must match on both images")
             return
         
-        status_label.config(text="Preparing animation...")
-        root.update()
-        
-        # Scale lines to original image coordinates
-        lines1_scaled = scale_lines_to_image(lines_image1, canvas_width, canvas_height,
-                                             image1_original.size[0], image1_original.size[1])
-        lines2_scaled = scale_lines_to_image(lines_image2, canvas_width, canvas_height,
-                                             image2_original.size[0], image2_original.size[1])
-        
-        # Ensure images are same size
-        target_size = image1_original.size
-        img2_resized = image2_original.resize(target_size, Image.Resampling.LANCZOS)
-        
-        # Adjust lines2_scaled if needed
-        if image2_original.size != target_size:
-            scale_x_adj = target_size[0] / image2_original.size[0]
-            scale_y_adj = target_size[1] / image2_original.size[1]
-            lines2_scaled = [((p[0]*scale_x_adj, p[1]*scale_y_adj), (q[0]*scale_x_adj, q[1]*scale_y_adj)) 
-                            for p, q in lines2_scaled]
+        # Snapshot the lines; canvas clicks can still add lines while the
+        # worker thread computes the frames
+        src_line_sets = (list(lines_image1), list(lines_image2))
         
         # Animation parameters
-        alpha_steps = [i * 0.1 for i in range(11)]  # 0, 0.1, 0.2, ..., 1.0
+        alpha_steps = np.linspace(0.0, 1.0, 11)  # 0, 0.1, 0.2, ..., 1.0
         frame_delay = 200  # milliseconds between frames
         
-        # Pre-compute all frames
-        status_label.config(text="Computing animation frames...")
-        root.update()
-        
-        # Generate grid if needed
-        grid_lines = None
-        if show_grid:
-            grid_lines = generate_grid(target_size[0], target_size[1], grid_spacing=30)
-        
-        frames = []
-        for alpha in alpha_steps:
-            # Interpolate lines
-            lines_interp = interpolate_lines(lines1_scaled, lines2_scaled, alpha)
-            
-            # Warp both images
-            warped1 = warp_image_with_lines(image1_original, lines1_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
-            warped2 = warp_image_with_lines(img2_resized, lines2_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
-            
-            # Blend
-            blended = blend_images(warped1, warped2, alpha)
-            
-            # Warp grids if grid visualization is enabled
-            warped_grid1 = None
-            warped_grid2 = None
-            if show_grid and grid_lines:
-                warped_grid1 = warp_grid_points(grid_lines, lines1_scaled, lines_interp, 
-                                               a=0.01, b=2.0, p=0.0, samples_per_line=20)
-                warped_grid2 = warp_grid_points(grid_lines, lines2_scaled, lines_interp, 
-                                               a=0.01, b=2.0, p=0.0, samples_per_line=20)
-            
-            frames.append((alpha, warped1, warped2, blended, warped_grid1, warped_grid2))
-            status_label.config(text=f"Computing frame {len(frames)}/{len(alpha_steps)}...")
-            root.update()
-        
-        # Play animation in ping-pong loop
-        status_label.config(text="Playing animation (press ESC to stop)...")
-        root.update()
+        # Reuse frames from a previous run with identical inputs (e.g. ESC then replay)
+        cache_key = ("warp", id(image1_original), id(image2_original),
+                     tuple(src_line_sets[0]), tuple(src_line_sets[1]),
+                     canvas_width, canvas_height, show_grid, keep_intermediate)
+        cached = _get_cached_frames(cache_key)
+        precompute_done = cached is not None
+        
+        # frames holds (alpha, warped_grid1, warped_grid2) per frame; the pixels
+        # live in one contiguous buffer indexed [frame, slot] with slots
+        # 0 = warped1, 1 = warped2, 2 = blended, or only the blended slot
+        # when intermediate warps are not kept
+        frame_slots = 3 if keep_intermediate else 1
+        blend_slot = frame_slots - 1
+        if cached is not None:
+            frames, frame_buf, latest_warps = cached
+        else:
+            frames, frame_buf, latest_warps = [], None, None
         
         # Animation control variables
         animation_running = True
         current_frame = 0
         direction = 1  # 1 for forward, -1 for backward
+        next_frame_time = 0.0  # time.monotonic() at which the next frame is due
+        cancel_event = threading.Event()
+        photo_cache = {}  # (frame index, output slot) -> PhotoImage
+        
+        def frame_photos(index):
+            """(canvas, PhotoImage) pairs showing frame index, built on first use"""
+            alpha, warped_grid1, warped_grid2 = frames[index]
+            if not (show_grid and warped_grid1 and warped_grid2):
+                warped_grid1 = warped_grid2 = None
+            
+            shown = [(output4_canvas, blend_slot, warped_grid1, "lime")]
+            if keep_intermediate:
+                shown = [(output1_canvas, 0, warped_grid1, "cyan"),
+                         (output2_canvas, 1, warped_grid2, "yellow")] + shown
+            
+            return [(canvas, _frame_photo(photo_cache, (index, slot), frame_buf[index, slot],
+                                          canvas_width, canvas_height, warped_grid, grid_color))
+                    for canvas, slot, warped_grid, grid_color in shown]
         
         def stop_animation(event=None):
             nonlocal animation_running
             animation_running = False
+            cancel_event.set()
         
-        def animate_frame():
-            nonlocal current_frame, animation_running, direction
+        def compute_frames(report, emit):
+            """Compute frames in order and emit each one. Runs on a worker thread, so no Tk calls here."""
+            nonlocal frame_buf
             
-            if not animation_running:
-                status_label.config(text="Animation stopped")
-                return
+            (img1_resized, img2_resized), (lines1_scaled, lines2_scaled), grid_lines = prepare_warp_sources(
+                (image1_original, image2_original), src_line_sets,
+                canvas_width, canvas_height, show_grid)
             
-            # Get current frame
-            alpha, warped1, warped2, blended, warped_grid1, warped_grid2 = frames[current_frame]
+            # Pre-compute all frames
+            report("Computing animation frames...")
             
-            # Display all three results with optional grid overlay
+            lines_interp_all = interpolate_lines_batch(lines1_scaled, lines2_scaled, alpha_steps)
+            jobs = [(0, lines1_scaled, 1, lines2_scaled, lines_interp) for lines_interp in lines_interp_all]
+            results = _compute_frames((img1_resized, img2_resized), (image1_original, image2_original),
+                                      grid_lines, jobs, cancel_event)
+            for i, (alpha, result) in enumerate(zip(alpha_steps, results)):
+                warped1, warped2, warped_grid1, warped_grid2 = result
+                
+                # Blend
+                blended = blend_images(warped1, warped2, alpha)
+                
+                # Copy the frame into the shared buffer (allocated once the frame shape is known)
+                if frame_buf is None:
+                    frame_buf = np.empty((len(alpha_steps), frame_slots) + np.asarray(blended).shape,
+                                         dtype=np.uint8)
+                if keep_intermediate:
+                    frame_buf[i, 0] = np.asarray(warped1)
+                    frame_buf[i, 1] = np.asarray(warped2)
+                frame_buf[i, blend_slot] = np.asarray(blended)
+                
+                # Warps that are not kept are handed over for display only
+                frame = (alpha, warped_grid1, warped_grid2)
+                emit((frame, None if keep_intermediate else (warped1, warped2, frame)))
+        
+        def show_latest_warps():
+            """Show the most recently computed warp pair on the Image 1/2 canvases"""
+            warped1, warped2, (alpha, warped_grid1, warped_grid2) = latest_warps
             if show_grid and warped_grid1 and warped_grid2:
-                display_image_with_grid_overlay(warped1, output1_canvas, warped_grid1, 
+                display_image_with_grid_overlay(warped1, output1_canvas, warped_grid1,
                                                canvas_width, canvas_height, grid_color="cyan")
-                display_image_with_grid_overlay(warped2, output2_canvas, warped_grid2, 
+                display_image_with_grid_overlay(warped2, output2_canvas, warped_grid2,
                                                canvas_width, canvas_height, grid_color="yellow")
-                output3_canvas.delete("all")  # Clear image 3 canvas (not used in 2-image mode)
-                display_image_with_grid_overlay(blended, output4_canvas, warped_grid1, 
-                                               canvas_width, canvas_height, grid_color="lime")
             else:
                 display_image_on_canvas(warped1, output1_canvas, canvas_width, canvas_height)
                 display_image_on_canvas(warped2, output2_canvas, canvas_width, canvas_height)
-                output3_canvas.delete("all")  # Clear image 3 canvas (not used in 2-image mode)
-                display_image_on_canvas(blended, output4_canvas, canvas_width, canvas_height)
+        
+        def on_frame_ready(item):
+            nonlocal latest_warps
+            frame, warps = item
+            frames.append(frame)
+            frame_photos(len(frames) - 1)  # Convert now so playback only swaps images
+            if warps is not None:
+                latest_warps = warps
+                show_latest_warps()
+            # Start playing as soon as the first frame exists
+            if len(frames) == 1:
+                start_playback()
+        
+        def on_frames_done():
+            nonlocal precompute_done
+            precompute_done = True
+            _store_cached_frames(cache_key, (image1_original, image2_original),
+                                 (frames, frame_buf, latest_warps))
+        
+        def start_playback():
+            nonlocal next_frame_time
+            # Play animation in ping-pong loop
+            status_label.config(text="Playing animation (press ESC to stop)...")
+            next_frame_time = time.monotonic()
+            animate_frame()
+        
+        def animate_frame():
+            nonlocal current_frame, animation_running, direction, next_frame_time
+            
+            if not animation_running:
+                status_label.config(text="Animation stopped")
+                return
+            
+            # Playback caught up with precompute: wait for the next frame
+            if current_frame >= len(frames):
+                if not cancel_event.is_set():
+                    root.after(_POLL_INTERVAL, animate_frame)
+                return
+            
+            # Get current frame
+            alpha = frames[current_frame][0]
+            
+            # Display the results (grid overlays are drawn into the photos)
+            for canvas, photo in frame_photos(current_frame):
+                show_photo_on_canvas(canvas, photo)
+            output3_canvas.delete("all")  # Clear image 3 canvas (not used in 2-image mode)
             
             # Update status with direction indicator
             direction_str = "→" if direction == 1 else "←"
-            status_label.config(text=f"Animation playing {direction_str} Alpha: {alpha:.1f} (Frame {current_frame + 1}/{len(frames)})")
-            
-            # Move to next frame
-            current_frame += direction
+            status_label.config(text=f"Animation playing {direction_str} Alpha: {alpha:.1f} (Frame {current_frame + 1}/{len(alpha_steps)})")
             
-            # Check boundaries and reverse direction
-            if current_frame >= len(frames):
-                current_frame = len(frames) - 2
-                direction = -1
-            elif current_frame < 0:
-                current_frame = 1
-                direction = 1
+            # Move to next frame, reversing at the ends
+            current_frame, direction = _advance_ping_pong(current_frame, direction,
+                                                          len(frames), precompute_done)
             
-            # Schedule next frame
+            # Schedule next frame on a fixed timeline so display time does not add
+            # to the delay; after a stall (e.g. waiting on precompute) restart from now
             if animation_running:
-                root.after(frame_delay, animate_frame)
+                next_frame_time = max(next_frame_time + frame_delay / 1000, time.monotonic())
+                root.after(_delay_until(next_frame_time), animate_frame)
         
-        # Bind ESC key to stop animation
+        # Bind ESC key to stop animation (also cancels frame precomputation)
         root.bind('<Escape>', stop_animation)
         
-        # Start animation
-        animate_frame()
-        
+        if precompute_done:
+            if latest_warps is not None:
+                show_latest_warps()
+            start_playback()
+        else:
+            status_label.config(text="Preparing animation...")
+            _run_in_background(root, status_label, compute_frames, on_frame_ready, on_frames_done,
+                               cancel_event, "Animation failed")
+    
     except Exception as e:
         messagebox.showerror("Error", f"Animation failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         status_label.config(text="Animation failed - see error message")
 
@@ -183,206 +748,163 @@ def create_sequential_animation(root, status_label, output1_canvas, output2_canv
             messagebox.showerror("Error", "Number of lines must match on all three images")
             return
         
-        status_label.config(text="Preparing sequential animation...")
-        root.update()
-        
-        # Scale lines to original image coordinates
-        lines1_scaled = scale_lines_to_image(lines_image1, canvas_width, canvas_height,
-                                             image1_original.size[0], image1_original.size[1])
-        lines2_scaled = scale_lines_to_image(lines_image2, canvas_width, canvas_height,
-                                             image2_original.size[0], image2_original.size[1])
-        lines3_scaled = scale_lines_to_image(lines_image3, canvas_width, canvas_height,
-                                             image3_original.size[0], image3_original.size[1])
-        
-        # Ensure all images are same size
-        target_size = image1_original.size
-        img2_resized = image2_original.resize(target_size, Image.Resampling.LANCZOS)
-        img3_resized = image3_original.resize(target_size, Image.Resampling.LANCZOS)
-        
-        # Adjust lines if images were resized
-        if image2_original.size != target_size:
-            scale_x = target_size[0] / image2_original.size[0]
-            scale_y = target_size[1] / image2_original.size[1]
-            lines2_scaled = [((p[0]*scale_x, p[1]*scale_y), (q[0]*scale_x, q[1]*scale_y)) 
-                            for p, q in lines2_scaled]
-        
-        if image3_original.size != target_size:
-            scale_x = target_size[0] / image3_original.size[0]
-            scale_y = target_size[1] / image3_original.size[1]
-            lines3_scaled = [((p[0]*scale_x, p[1]*scale_y), (q[0]*scale_x, q[1]*scale_y)) 
-                            for p, q in lines3_scaled]
+        # Snapshot the lines; canvas clicks can still add lines while the
+        # worker thread computes the frames
+        src_line_sets = (list(lines_image1), list(lines_image2), list(lines_image3))
         
         # Animation parameters
-        alpha_steps = [i * 0.1 for i in range(11)]  # 0, 0.1, 0.2, ..., 1.0
+        alpha_steps = np.linspace(0.0, 1.0, 11)  # 0, 0.1, 0.2, ..., 1.0
         frame_delay = 200  # milliseconds
         
-        # Generate grid if needed
-        grid_lines = None
-        if show_grid:
-            grid_lines = generate_grid(target_size[0], target_size[1], grid_spacing=30)
+        # Reuse frames from a previous run with identical inputs (e.g. ESC then replay)
+        cache_key = ("sequential", id(image1_original), id(image2_original), id(image3_original),
+                     tuple(src_line_sets[0]), tuple(src_line_sets[1]), tuple(src_line_sets[2]),
+                     canvas_width, canvas_height, show_grid)
+        cached = _get_cached_frames(cache_key)
+        precompute_done = cached is not None
         
-        # Pre-compute all frames for both transitions
-        status_label.config(text="Computing transition 1→2...")
-        root.update()
+        # Animation control variables; frame images are views into frame_buf
+        all_frames = cached if cached is not None else []
+        frame_buf = None  # (frame, slot, H, W, C) uint8: warped a, warped b, blended
+        animation_running = True
+        current_frame = 0
+        direction = 1  # 1 for forward, -1 for backward
+        next_frame_time = 0.0  # time.monotonic() at which the next frame is due
+        cancel_event = threading.Event()
+        photo_cache = {}  # (frame index, output slot) -> PhotoImage
         
-        frames_1_to_2 = []
-        for alpha in alpha_steps:
-            # Transition from image 1 to image 2
-            lines_interp = interpolate_lines(lines1_scaled, lines2_scaled, alpha)
-            
-            warped1 = warp_image_with_lines(image1_original, lines1_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
-            warped2 = warp_image_with_lines(img2_resized, lines2_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
+        def frame_photos(index):
+            """(canvas, PhotoImage or None) pairs showing frame index, built on first use"""
+            alpha, warped1, warped2, warped3, blended, desc, grid1, grid2, grid3 = all_frames[index]
             
-            blended = blend_images(warped1, warped2, alpha)
+            # Blend overlay uses grid1 or grid2 depending on which exists
+            shown = ((output1_canvas, 1, warped1, grid1, "cyan"),
+                     (output2_canvas, 2, warped2, grid2, "yellow"),
+                     (output3_canvas, 3, warped3, grid3, "magenta"),
+                     (output4_canvas, 4, blended, grid1 if grid1 else grid2, "lime"))
             
-            # Warp grids if visualization is enabled
-            warped_grid1 = None
-            warped_grid2 = None
-            if show_grid and grid_lines:
-                warped_grid1 = warp_grid_points(grid_lines, lines1_scaled, lines_interp, 
-                                              a=0.01, b=2.0, p=0.0, samples_per_line=20)
-                warped_grid2 = warp_grid_points(grid_lines, lines2_scaled, lines_interp, 
-                                              a=0.01, b=2.0, p=0.0, samples_per_line=20)
-            
-            # Store: alpha, warped1, warped2, None (no warped3), blended, desc, grids
-            frames_1_to_2.append((alpha, warped1, warped2, None, blended, f"1→2: α={alpha:.1f}", 
-                                 warped_grid1, warped_grid2, None))
-            
-            status_label.config(text=f"Computing 1→2 frame {len(frames_1_to_2)}/{len(alpha_steps)}...")
-            root.update()
+            photos = []
+            for canvas, slot, image, warped_grid, grid_color in shown:
+                if image is None:
+                    photos.append((canvas, None))
+                    continue
+                photo = _frame_photo(photo_cache, (index, slot), image, canvas_width, canvas_height,
+                                     warped_grid if show_grid else None, grid_color)
+                photos.append((canvas, photo))
+            return photos
         
-        status_label.config(text="Computing transition 2→3...")
-        root.update()
+        def stop_animation(event=None):
+            nonlocal animation_running
+            animation_running = False
+            cancel_event.set()
         
-        frames_2_to_3 = []
-        for alpha in alpha_steps:
-            # Transition from image 2 to image 3
-            lines_interp = interpolate_lines(lines2_scaled, lines3_scaled, alpha)
-            
-            warped2 = warp_image_with_lines(img2_resized, lines2_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
-            warped3 = warp_image_with_lines(img3_resized, lines3_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
+        def compute_frames(report, emit):
+            """Compute both transitions in order and emit each frame. Runs on a worker thread, so no Tk calls here."""
+            nonlocal frame_buf
             
-            blended = blend_images(warped2, warped3, alpha)
+            resized, (lines1_scaled, lines2_scaled, lines3_scaled), grid_lines = prepare_warp_sources(
+                (image1_original, image2_original, image3_original), src_line_sets,
+                canvas_width, canvas_height, show_grid)
             
-            # Warp grids if visualization is enabled
-            warped_grid2 = None
-            warped_grid3 = None
-            if show_grid and grid_lines:
-                warped_grid2 = warp_grid_points(grid_lines, lines2_scaled, lines_interp, 
-                                              a=0.01, b=2.0, p=0.0, samples_per_line=20)
-                warped_grid3 = warp_grid_points(grid_lines, lines3_scaled, lines_interp, 
-                                              a=0.01, b=2.0, p=0.0, samples_per_line=20)
+            # Pre-compute all frames for both transitions
+            report("Computing transitions 1→2 and 2→3...")
             
-            # Store: alpha, None (no warped1), warped2, warped3, blended, desc, grids
-            frames_2_to_3.append((alpha, None, warped2, warped3, blended, f"2→3: α={alpha:.1f}", 
-                                 None, warped_grid2, warped_grid3))
-            
-            status_label.config(text=f"Computing 2→3 frame {len(frames_2_to_3)}/{len(alpha_steps)}...")
-            root.update()
-        
-        # Combine frames: 1→2 then 2→3
-        all_frames = frames_1_to_2 + frames_2_to_3[1:]  # Skip duplicate at boundary
-        
-        # Play animation in ping-pong loop
-        status_label.config(text="Playing sequential animation (press ESC to stop)...")
-        root.update()
-        
-        # Animation control variables
-        animation_running = True
-        current_frame = 0
-        direction = 1  # 1 for forward, -1 for backward
-        
-        def stop_animation(event=None):
-            nonlocal animation_running
-            animation_running = False
+            alphas, jobs = _sequential_frame_jobs((lines1_scaled, lines2_scaled, lines3_scaled),
+                                                  alpha_steps)
+            results = _compute_frames(resized, (image1_original, image2_original, image3_original),
+                                      grid_lines, jobs, cancel_event)
+            for i, (alpha, result) in enumerate(zip(alphas, results)):
+                warped_a, warped_b, warped_grid_a, warped_grid_b = result
+                blended = blend_images(warped_a, warped_b, alpha)
+                
+                # Copy the frame into the shared buffer (allocated once the frame shape is known)
+                if frame_buf is None:
+                    frame_buf = np.empty((len(jobs), 3) + np.asarray(blended).shape, dtype=np.uint8)
+                frame_buf[i, 0] = np.asarray(warped_a)
+                frame_buf[i, 1] = np.asarray(warped_b)
+                frame_buf[i, 2] = np.asarray(blended)
+                warped_a, warped_b, blended = frame_buf[i]
+                
+                if i < len(alpha_steps):
+                    # Store: alpha, warped1, warped2, None (no warped3), blended, desc, grids
+                    emit((alpha, warped_a, warped_b, None, blended, f"1→2: α={alpha:.1f}",
+                          warped_grid_a, warped_grid_b, None))
+                else:
+                    # Store: alpha, None (no warped1), warped2, warped3, blended, desc, grids
+                    emit((alpha, None, warped_a, warped_b, blended, f"2→3: α={alpha:.1f}",
+                          None, warped_grid_a, warped_grid_b))
+        
+        # Frames arrive 1→2 then 2→3
+        total_frames = 2 * len(alpha_steps) - 1
+        
+        def on_frame_ready(frame):
+            all_frames.append(frame)
+            frame_photos(len(all_frames) - 1)  # Convert now so playback only swaps images
+            # Start playing as soon as the first frame exists
+            if len(all_frames) == 1:
+                start_playback()
+        
+        def on_frames_done():
+            nonlocal precompute_done
+            precompute_done = True
+            _store_cached_frames(cache_key, (image1_original, image2_original, image3_original),
+                                 all_frames)
+        
+        def start_playback():
+            nonlocal next_frame_time
+            # Play animation in ping-pong loop
+            status_label.config(text="Playing sequential animation (press ESC to stop)...")
+            next_frame_time = time.monotonic()
+            animate_frame()
         
         def animate_frame():
-            nonlocal current_frame, animation_running, direction
+            nonlocal current_frame, animation_running, direction, next_frame_time
             
             if not animation_running:
                 status_label.config(text="Animation stopped")
                 return
             
+            # Playback caught up with precompute: wait for the next frame
+            if current_frame >= len(all_frames):
+                if not cancel_event.is_set():
+                    root.after(_POLL_INTERVAL, animate_frame)
+                return
+            
             # Get current frame
-            alpha, warped1, warped2, warped3, blended, desc, grid1, grid2, grid3 = all_frames[current_frame]
+            desc = all_frames[current_frame][5]
             
-            # Display all warped images and blend
-            if show_grid:
-                # Display with grid overlays
-                if warped1 and grid1:
-                    display_image_with_grid_overlay(warped1, output1_canvas, grid1, 
-                                                   canvas_width, canvas_height, grid_color="cyan")
-                else:
-                    output1_canvas.delete("all")
-                
-                if warped2 and grid2:
-                    display_image_with_grid_overlay(warped2, output2_canvas, grid2, 
-                                                   canvas_width, canvas_height, grid_color="yellow")
-                else:
-                    output2_canvas.delete("all")
-                
-                if warped3 and grid3:
-                    display_image_with_grid_overlay(warped3, output3_canvas, grid3, 
-                                                   canvas_width, canvas_height, grid_color="magenta")
+            # Display all warped images and blend (grid overlays are drawn into the photos)
+            for canvas, photo in frame_photos(current_frame):
+                if photo is None:
+                    canvas.delete("all")
                 else:
-                    output3_canvas.delete("all")
-                
-                # Display blend with grid overlay (use grid1 or grid2 depending on which exists)
-                blend_grid = grid1 if grid1 else grid2
-                if blend_grid:
-                    display_image_with_grid_overlay(blended, output4_canvas, blend_grid, 
-                                                   canvas_width, canvas_height, grid_color="lime")
-                else:
-                    display_image_on_canvas(blended, output4_canvas, canvas_width, canvas_height)
-            else:
-                # Display without grid overlays
-                if warped1:
-                    display_image_on_canvas(warped1, output1_canvas, canvas_width, canvas_height)
-                else:
-                    output1_canvas.delete("all")
-                
-                if warped2:
-                    display_image_on_canvas(warped2, output2_canvas, canvas_width, canvas_height)
-                else:
-                    output2_canvas.delete("all")
-                
-                if warped3:
-                    display_image_on_canvas(warped3, output3_canvas, canvas_width, canvas_height)
-                else:
-                    output3_canvas.delete("all")
-                
-                display_image_on_canvas(blended, output4_canvas, canvas_width, canvas_height)
+                    show_photo_on_canvas(canvas, photo)
             
             # Update status with direction indicator
             direction_str = "→" if direction == 1 else "←"
-            status_label.config(text=f"Sequential animation {direction_str} {desc} (Frame {current_frame + 1}/{len(all_frames)})")
-            
-            # Move to next frame
-            current_frame += direction
+            status_label.config(text=f"Sequential animation {direction_str} {desc} (Frame {current_frame + 1}/{total_frames})")
             
-            # Check boundaries and reverse direction
-            if current_frame >= len(all_frames):
-                current_frame = len(all_frames) - 2
-                direction = -1
-            elif current_frame < 0:
-                current_frame = 1
-                direction = 1
+            # Move to next frame, reversing at the ends
+            current_frame, direction = _advance_ping_pong(current_frame, direction,
+                                                          len(all_frames), precompute_done)
             
-            # Schedule next frame
+            # Schedule next frame on a fixed timeline so display time does not add
+            # to the delay; after a stall (e.g. waiting on precompute) restart from now
             if animation_running:
-                root.after(frame_delay, animate_frame)
+                next_frame_time = max(next_frame_time + frame_delay / 1000, time.monotonic())
+                root.after(_delay_until(next_frame_time), animate_frame)
         
-        # Bind ESC key to stop animation
+        # Bind ESC key to stop animation (also cancels frame precomputation)
         root.bind('<Escape>', stop_animation)
         
-        # Start animation
-        animate_frame()
-        
+        if precompute_done:
+            start_playback()
+        else:
+            status_label.config(text="Preparing sequential animation...")
+            _run_in_background(root, status_label, compute_frames, on_frame_ready, on_frames_done,
+                               cancel_event, "Sequential animation failed")
+    
     except Exception as e:
         messagebox.showerror("Error", f"Sequential animation failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         status_label.config(text="Sequential animation failed - see error message")
-
-
-
@@ -5,13 +5,18 @@ Main GUI Application
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, Canvas
-from PIL import Image
-import math
+from PIL import Image, ImageOps, ExifTags
+import os
+import queue
+import threading
+import traceback
 
 # Import our modular components
-from morph_algorithm import (warp_image_with_lines, interpolate_lines, blend_images, 
-                             generate_grid, warp_grid_points, merge_multiple_images)
-from ui_helpers import display_image_on_canvas, redraw_canvas_with_lines, scale_lines_to_image, display_image_with_grid_overlay
+from morph_algorithm import (warp_pair_with_shared_dest, interpolate_lines, blend_images,
+                             warp_grid_points, warp_grid_pair_with_shared_dest,
+                             merge_multiple_images)
+from ui_helpers import display_image_on_canvas, redraw_canvas_with_lines, display_image_with_grid_overlay
+from animations import prepare_warp_sources, grid_for_warp
 
 
 def main():
@@ -54,6 +59,14 @@ def main():
     CANVAS_WIDTH = 400
     CANVAS_HEIGHT = 300
     
+    # How often the Tk thread checks on background morphing work (milliseconds)
+    POLL_INTERVAL = 50
+    
+    # Resized images and scaled lines of the last single morph, reused while only
+    # alpha changes: key -> (source images, resized images, scaled line sets).
+    # Holding the source images keeps their id() in the key unique.
+    morph_inputs_cache = {}
+    
     # ==================== UI COMPONENTS ====================
     
     # Status section at top
@@ -204,8 +217,20 @@ def main():
                                          foreground="blue", font=("Arial", 9))
     normalized_weights_label.pack(side=tk.LEFT, padx=(10, 0))
     
-    # Update normalized weights display when sliders change
-    def update_normalized_display(*args):
+    # Update normalized weights display when sliders change; writes are
+    # coalesced so a slider drag (or all three weights being set at once)
+    # relabels at most every 50 ms
+    normalized_update_pending = False
+    
+    def schedule_normalized_display(*args):
+        nonlocal normalized_update_pending
+        if not normalized_update_pending:
+            normalized_update_pending = True
+            root.after(50, update_normalized_display)
+    
+    def update_normalized_display():
+        nonlocal normalized_update_pending
+        normalized_update_pending = False
         t1, t2, t3 = weight1_var.get(), weight2_var.get(), weight3_var.get()
         weight_sum = t1 + t2 + t3
         if weight_sum > 0:
@@ -216,9 +241,9 @@ def main():
         else:
             normalized_weights_label.config(text="Normalized: [0.333, 0.333, 0.334]")
     
-    weight1_var.trace_add('write', update_normalized_display)
-    weight2_var.trace_add('write', update_normalized_display)
-    weight3_var.trace_add('write', update_normalized_display)
+    weight1_var.trace_add('write', schedule_normalized_display)
+    weight2_var.trace_add('write', schedule_normalized_display)
+    weight3_var.trace_add('write', schedule_normalized_display)
     
     # Merge button
     btn_merge_three = ttk.Button(merge_frame, text="Merge Three Images")
@@ -273,21 +298,18 @@ def main():
     
     # ==================== HELPER FUNCTIONS ====================
     
+    def image_slot(image_num):
+        """(canvas, loaded image, lines) of image 1, 2 or 3"""
+        return ((canvas1, image1_original, lines_image1),
+                (canvas2, image2_original, lines_image2),
+                (canvas3, image3_original, lines_image3))[image_num - 1]
+    
     def update_instruction_label():
         """Update instruction based on current state"""
-        nonlocal expecting_image_num, is_three_image_mode
-        if is_three_image_mode:
-            if expecting_image_num == 1:
-                instruction_label.config(text="→ Draw line on IMAGE 1")
-            elif expecting_image_num == 2:
-                instruction_label.config(text="→ Draw corresponding line on IMAGE 2")
-            else:
-                instruction_label.config(text="→ Draw corresponding line on IMAGE 3")
+        if expecting_image_num == 1:
+            instruction_label.config(text="→ Draw line on IMAGE 1")
         else:
-            if expecting_image_num == 1:
-                instruction_label.config(text="→ Draw line on IMAGE 1")
-            else:
-                instruction_label.config(text="→ Draw corresponding line on IMAGE 2")
+            instruction_label.config(text=f"→ Draw corresponding line on IMAGE {expecting_image_num}")
     
     def open_image(image_num):
         """Open file dialog to select an image"""
@@ -302,22 +324,31 @@ def main():
         if file_path:
             try:
                 image = Image.open(file_path)
+                # Normalize once at load: apply EXIF orientation and make every
+                # source RGB so warping and blending never see mixed modes.
+                # Untouched RGB files keep their format/filename, which lets
+                # animations decode JPEGs at reduced scale with draft().
+                if image.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+                    image = ImageOps.exif_transpose(image)
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                image.load()
                 
                 if image_num == 1:
                     image1_path = file_path
                     image1_original = image
                     display_image_on_canvas(image, canvas1, CANVAS_WIDTH, CANVAS_HEIGHT)
-                    status_label.config(text=f"Image 1 loaded: {file_path.split('/')[-1]}")
+                    status_label.config(text=f"Image 1 loaded: {os.path.basename(file_path)}")
                 elif image_num == 2:
                     image2_path = file_path
                     image2_original = image
                     display_image_on_canvas(image, canvas2, CANVAS_WIDTH, CANVAS_HEIGHT)
-                    status_label.config(text=f"Image 2 loaded: {file_path.split('/')[-1]}")
+                    status_label.config(text=f"Image 2 loaded: {os.path.basename(file_path)}")
                 elif image_num == 3:
                     image3_path = file_path
                     image3_original = image
                     display_image_on_canvas(image, canvas3, CANVAS_WIDTH, CANVAS_HEIGHT)
-                    status_label.config(text=f"Image 3 loaded: {file_path.split('/')[-1]}")
+                    status_label.config(text=f"Image 3 loaded: {os.path.basename(file_path)}")
                 
                 update_instruction_label()
                 
@@ -334,12 +365,10 @@ def main():
         current_line_start = None
         
         # Redraw canvases
-        if image1_original:
-            display_image_on_canvas(image1_original, canvas1, CANVAS_WIDTH, CANVAS_HEIGHT)
-        if image2_original:
-            display_image_on_canvas(image2_original, canvas2, CANVAS_WIDTH, CANVAS_HEIGHT)
-        if image3_original:
-            display_image_on_canvas(image3_original, canvas3, CANVAS_WIDTH, CANVAS_HEIGHT)
+        for image_num in (1, 2, 3):
+            canvas, image, _ = image_slot(image_num)
+            if image:
+                display_image_on_canvas(image, canvas, CANVAS_WIDTH, CANVAS_HEIGHT)
         
         # Clear output canvases
         output1_canvas.delete("all")
@@ -365,7 +394,7 @@ def main():
     
     def on_canvas_release(event, canvas, image_num):
         """Handle mouse release on canvas"""
-        nonlocal current_line_start, expecting_image_num, lines_image1, lines_image2, lines_image3
+        nonlocal current_line_start, expecting_image_num
         
         if current_line_start is None:
             return
@@ -376,54 +405,37 @@ def main():
         
         line_end = (event.x, event.y)
         
-        # Only add line if it has some length
-        dist = math.sqrt((line_end[0] - current_line_start[0])**2 + (line_end[1] - current_line_start[1])**2)
-        if dist < 5:
+        # Only add line if it has some length (at least 5 pixels)
+        dx = line_end[0] - current_line_start[0]
+        dy = line_end[1] - current_line_start[1]
+        if dx * dx + dy * dy < 25:
+            canvas.delete("preview")
             current_line_start = None
             return
         
-        # Add line to appropriate list based on mode
-        if is_three_image_mode:
-            # 3-image mode: sequence 1 -> 2 -> 3
-            if image_num == 1:
-                lines_image1.append((current_line_start, line_end))
-                redraw_canvas_with_lines(canvas1, image1_original, lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT, False)
-                redraw_canvas_with_lines(canvas2, image2_original, lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-                expecting_image_num = 2
-                status_label.config(text=f"Line {len(lines_image1)} added to Image 1 - Now draw on Image 2")
-            elif image_num == 2:
-                lines_image2.append((current_line_start, line_end))
-                redraw_canvas_with_lines(canvas2, image2_original, lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT, False)
-                redraw_canvas_with_lines(canvas3, image3_original, lines_image3, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-                expecting_image_num = 3
-                status_label.config(text=f"Line {len(lines_image2)} added to Image 2 - Now draw on Image 3")
-            else:  # image_num == 3
-                lines_image3.append((current_line_start, line_end))
-                redraw_canvas_with_lines(canvas3, image3_original, lines_image3, CANVAS_WIDTH, CANVAS_HEIGHT, False)
-                redraw_canvas_with_lines(canvas1, image1_original, lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-                expecting_image_num = 1
-                status_label.config(text=f"Line triplet {len(lines_image3)} complete - Draw next line on Image 1")
+        # Add line to this image, then hand over to the next one in the
+        # sequence (1 -> 2 -> 3 in 3-image mode, alternating 1 <-> 2 otherwise)
+        num_images = 3 if is_three_image_mode else 2
+        next_image_num = image_num % num_images + 1
+        
+        _, image, lines = image_slot(image_num)
+        lines.append((current_line_start, line_end))
+        redraw_canvas_with_lines(canvas, image, lines, CANVAS_WIDTH, CANVAS_HEIGHT, False)
+        redraw_canvas_with_lines(*image_slot(next_image_num), CANVAS_WIDTH, CANVAS_HEIGHT, True)
+        expecting_image_num = next_image_num
+        
+        if next_image_num == 1:
+            group = "triplet" if is_three_image_mode else "pair"
+            status_label.config(text=f"Line {group} {len(lines)} complete - Draw next line on Image 1")
         else:
-            # 2-image mode: alternating 1 <-> 2
-            if image_num == 1:
-                lines_image1.append((current_line_start, line_end))
-                redraw_canvas_with_lines(canvas1, image1_original, lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT, False)
-                redraw_canvas_with_lines(canvas2, image2_original, lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-                expecting_image_num = 2
-                status_label.config(text=f"Line {len(lines_image1)} added to Image 1 - Now draw on Image 2")
-            else:  # image_num == 2
-                lines_image2.append((current_line_start, line_end))
-                redraw_canvas_with_lines(canvas2, image2_original, lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT, False)
-                redraw_canvas_with_lines(canvas1, image1_original, lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-                expecting_image_num = 1
-                status_label.config(text=f"Line pair {len(lines_image2)} complete - Draw next line on Image 1")
+            status_label.config(text=f"Line {len(lines)} added to Image {image_num} - Now draw on Image {next_image_num}")
         
         update_instruction_label()
         current_line_start = None
     
     def on_canvas_motion(event, canvas, image_num):
         """Handle mouse motion for drawing preview"""
-        nonlocal current_line_start, expecting_image_num
+        nonlocal current_line_start, expecting_image_num, pending_motion
         
         if current_line_start is None:
             return
@@ -432,30 +444,53 @@ def main():
         if image_num != expecting_image_num:
             return
         
-        # Redraw with preview line
-        if image_num == 1:
-            redraw_canvas_with_lines(canvas1, image1_original, lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-        elif image_num == 2:
-            redraw_canvas_with_lines(canvas2, image2_original, lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT, True)
-        else:
-            redraw_canvas_with_lines(canvas3, image3_original, lines_image3, CANVAS_WIDTH, CANVAS_HEIGHT, True)
+        # Bursts of motion events collapse into a single preview update once
+        # Tk is idle; only the latest pointer position matters
+        if pending_motion is None:
+            root.after_idle(flush_motion)
+        pending_motion = (canvas, image_num, event.x, event.y)
+    
+    pending_motion = None
+    
+    def flush_motion():
+        """Move the drag preview to the latest pointer position"""
+        nonlocal pending_motion
+        canvas, image_num, x, y = pending_motion
+        pending_motion = None
         
-        # Draw preview line
-        canvas.create_line(current_line_start[0], current_line_start[1], 
-                          event.x, event.y, fill="yellow", width=2, dash=(5, 5))
+        # The line may have been released (or aborted) in the meantime
+        if current_line_start is None or image_num != expecting_image_num:
+            return
+        
+        # Move the preview line in place; the image and committed lines stay
+        # as they are (the canvas is redrawn once the line is released)
+        preview = canvas.find_withtag("preview")
+        if preview:
+            canvas.coords(preview[0], current_line_start[0], current_line_start[1], x, y)
+        else:
+            # First motion of this drag: highlight the canvas being drawn on
+            canvas.config(highlightbackground="green", highlightthickness=3)
+            canvas.create_line(current_line_start[0], current_line_start[1],
+                              x, y, fill="yellow", width=2, dash=(5, 5), tags="preview")
     
-    # Bind mouse events to all canvases
-    canvas1.bind("<Button-1>", lambda e: on_canvas_press(e, canvas1, 1))
-    canvas1.bind("<ButtonRelease-1>", lambda e: on_canvas_release(e, canvas1, 1))
-    canvas1.bind("<B1-Motion>", lambda e: on_canvas_motion(e, canvas1, 1))
+    # Bind one shared handler per mouse event; the canvas and its image
+    # number come from the event's widget
+    for canvas, image_num in ((canvas1, 1), (canvas2, 2), (canvas3, 3)):
+        canvas.image_num = image_num
     
-    canvas2.bind("<Button-1>", lambda e: on_canvas_press(e, canvas2, 2))
-    canvas2.bind("<ButtonRelease-1>", lambda e: on_canvas_release(e, canvas2, 2))
-    canvas2.bind("<B1-Motion>", lambda e: on_canvas_motion(e, canvas2, 2))
+    def dispatch_press(event):
+        on_canvas_press(event, event.widget, event.widget.image_num)
     
-    canvas3.bind("<Button-1>", lambda e: on_canvas_press(e, canvas3, 3))
-    canvas3.bind("<ButtonRelease-1>", lambda e: on_canvas_release(e, canvas3, 3))
-    canvas3.bind("<B1-Motion>", lambda e: on_canvas_motion(e, canvas3, 3))
+    def dispatch_release(event):
+        on_canvas_release(event, event.widget, event.widget.image_num)
+    
+    def dispatch_motion(event):
+        on_canvas_motion(event, event.widget, event.widget.image_num)
+    
+    for canvas in (canvas1, canvas2, canvas3):
+        canvas.bind("<Button-1>", dispatch_press)
+        canvas.bind("<ButtonRelease-1>", dispatch_release)
+        canvas.bind("<B1-Motion>", dispatch_motion)
     
     # Connect button commands
     btn_image1.config(command=lambda: open_image(1))
@@ -468,6 +503,52 @@ def main():
     
     # ==================== MORPHING FUNCTIONS ====================
     
+    def run_in_background(compute, on_done, error_message):
+        """
+        Run compute(report) on a worker thread, then on_done(result) on the Tk thread.
+        
+        The worker must not touch Tk; report(text) posts a status message that
+        the Tk thread shows on its next poll. The morph buttons are disabled
+        until the work finishes so runs cannot overlap.
+        """
+        messages = queue.Queue()
+        morph_buttons = (btn_set_alpha, btn_merge_three)
+        
+        def worker():
+            try:
+                result = compute(lambda text: messages.put(("status", text)))
+                messages.put(("done", result))
+            except Exception as e:
+                traceback.print_exc()
+                messages.put(("error", e))
+        
+        def poll():
+            while True:
+                try:
+                    kind, value = messages.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if kind == "status":
+                    status_label.config(text=value)
+                    continue
+                
+                for button in morph_buttons:
+                    button.state(["!disabled"])
+                if kind == "done":
+                    on_done(value)
+                else:
+                    messagebox.showerror("Error", f"{error_message}: {str(value)}")
+                    status_label.config(text=f"{error_message} - see error message")
+                return
+            
+            root.after(POLL_INTERVAL, poll)
+        
+        for button in morph_buttons:
+            button.state(["disabled"])
+        threading.Thread(target=worker, daemon=True).start()
+        root.after(POLL_INTERVAL, poll)
+    
     def set_alpha_and_run():
         """Execute morphing with current alpha value (2-image mode only)"""
         try:
@@ -493,57 +574,70 @@ def main():
                 return
             
             status_label.config(text=f"Computing morph with alpha={alpha}...")
-            root.update()
-            
-            # Scale lines to original image coordinates
-            lines1_scaled = scale_lines_to_image(lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT,
-                                                 image1_original.size[0], image1_original.size[1])
-            lines2_scaled = scale_lines_to_image(lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT,
-                                                 image2_original.size[0], image2_original.size[1])
             
-            # Ensure images are same size
-            target_size = image1_original.size
-            img2_resized = image2_original.resize(target_size, Image.Resampling.LANCZOS)
+            # Snapshot the inputs; the worker must not read Tk variables
+            src_image1, src_image2 = image1_original, image2_original
+            src_lines1, src_lines2 = list(lines_image1), list(lines_image2)
+            show_grid = show_grid_var.get()
+            inputs_key = (id(src_image1), id(src_image2), tuple(src_lines1), tuple(src_lines2))
             
-            # Adjust lines2_scaled if needed
-            if image2_original.size != target_size:
-                scale_x_adj = target_size[0] / image2_original.size[0]
-                scale_y_adj = target_size[1] / image2_original.size[1]
-                lines2_scaled = [((p[0]*scale_x_adj, p[1]*scale_y_adj), (q[0]*scale_x_adj, q[1]*scale_y_adj)) 
-                                for p, q in lines2_scaled]
-            
-            # Interpolate lines
-            lines_interp = interpolate_lines(lines1_scaled, lines2_scaled, alpha)
-            
-            # Warp both images
-            status_label.config(text="Warping Image 1...")
-            root.update()
-            warped1 = warp_image_with_lines(image1_original, lines1_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
-            
-            status_label.config(text="Warping Image 2...")
-            root.update()
-            warped2 = warp_image_with_lines(img2_resized, lines2_scaled, lines_interp, a=0.01, b=2.0, p=0.0)
-            
-            # Blend
-            status_label.config(text="Blending images...")
-            root.update()
-            blended = blend_images(warped1, warped2, alpha)
-            
-            # Display results with optional grid visualization
-            if show_grid_var.get():
-                status_label.config(text="Computing grid visualization...")
-                root.update()
+            def compute(report):
+                """Warp, blend and warp the grid. Runs on a worker thread, so no Tk calls here."""
+                cached = morph_inputs_cache.get(inputs_key)
+                if cached is not None:
+                    _, (img1_resized, img2_resized), (lines1_scaled, lines2_scaled) = cached
+                else:
+                    # The results are only ever shown on the canvases, so warp at
+                    # display resolution like the animations do
+                    resized, scaled, _ = prepare_warp_sources((src_image1, src_image2), (src_lines1, src_lines2),
+                                                              CANVAS_WIDTH, CANVAS_HEIGHT, show_grid=False)
+                    img1_resized, img2_resized = resized
+                    lines1_scaled, lines2_scaled = scaled
+                    
+                    # Only the latest inputs are worth keeping
+                    morph_inputs_cache.clear()
+                    morph_inputs_cache[inputs_key] = ((src_image1, src_image2), resized, scaled)
+                target_size = img1_resized.size
                 
-                # Generate grid for the image
-                grid_lines = generate_grid(target_size[0], target_size[1], grid_spacing=30)
+                # Interpolate lines
+                lines_interp = interpolate_lines(lines1_scaled, lines2_scaled, alpha)
                 
-                # Warp grid from image1 to interpolated position
-                warped_grid1 = warp_grid_points(grid_lines, lines1_scaled, lines_interp, 
-                                                a=0.01, b=2.0, p=0.0, samples_per_line=20)
+                # Warp both images (they share the interpolated destination lines)
+                report("Warping images...")
+                warped1, warped2 = warp_pair_with_shared_dest(img1_resized, img2_resized,
+                                                              lines1_scaled, lines2_scaled, lines_interp,
+                                                              a=0.01, b=2.0, p=0.0)
                 
-                # Warp grid from image2 to interpolated position
-                warped_grid2 = warp_grid_points(grid_lines, lines2_scaled, lines_interp, 
-                                                a=0.01, b=2.0, p=0.0, samples_per_line=20)
+                # Blend
+                report("Blending images...")
+                blended = blend_images(warped1, warped2, alpha)
+                
+                warped_grids = None
+                if show_grid:
+                    report("Computing grid visualization...")
+                    
+                    # Warp the grid from each image to the interpolated position
+                    grid_lines = grid_for_warp(src_image1, target_size)
+                    warped_grids = warp_grid_pair_with_shared_dest(grid_lines, lines1_scaled, lines2_scaled,
+                                                                   lines_interp, a=0.01, b=2.0, p=0.0,
+                                                                   samples_per_line=20)
+                
+                return warped1, warped2, blended, warped_grids
+            
+            run_in_background(compute, lambda result: show_morph_result(alpha, len(src_lines1), *result),
+                              "Morphing failed")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Morphing failed: {str(e)}")
+            traceback.print_exc()
+            status_label.config(text="Morphing failed - see error message")
+    
+    def show_morph_result(alpha, num_lines, warped1, warped2, blended, warped_grids):
+        """Display a finished morph (Tk thread)"""
+        try:
+            # Display results with optional grid visualization
+            if warped_grids is not None:
+                warped_grid1, warped_grid2 = warped_grids
                 
                 # Display images with grid overlays
                 display_image_with_grid_overlay(warped1, output1_canvas, warped_grid1, 
@@ -560,11 +654,10 @@ def main():
                 output3_canvas.delete("all")  # Clear image 3 canvas (not used in 2-image mode)
                 display_image_on_canvas(blended, output4_canvas, CANVAS_WIDTH, CANVAS_HEIGHT)
             
-            status_label.config(text=f"Morphing complete! Alpha={alpha}, {len(lines_image1)} line pairs used")
+            status_label.config(text=f"Morphing complete! Alpha={alpha}, {num_lines} line pairs used")
             
         except Exception as e:
             messagebox.showerror("Error", f"Morphing failed: {str(e)}")
-            import traceback
             traceback.print_exc()
             status_label.config(text="Morphing failed - see error message")
     
@@ -598,44 +691,56 @@ def main():
             weights = [t1, t2, t3]
             
             status_label.config(text=f"Merging 3 images with weights [{t1:.3f}, {t2:.3f}, {t3:.3f}]...")
-            root.update()
             
-            # Scale lines to original image coordinates
-            lines1_scaled = scale_lines_to_image(lines_image1, CANVAS_WIDTH, CANVAS_HEIGHT,
-                                                 image1_original.size[0], image1_original.size[1])
-            lines2_scaled = scale_lines_to_image(lines_image2, CANVAS_WIDTH, CANVAS_HEIGHT,
-                                                 image2_original.size[0], image2_original.size[1])
-            lines3_scaled = scale_lines_to_image(lines_image3, CANVAS_WIDTH, CANVAS_HEIGHT,
-                                                 image3_original.size[0], image3_original.size[1])
+            # Snapshot the inputs; the worker must not read Tk variables
+            src_images = (image1_original, image2_original, image3_original)
+            src_line_sets = (list(lines_image1), list(lines_image2), list(lines_image3))
+            show_grid = show_grid_var.get()
             
-            # Perform multiple image merge
-            status_label.config(text="Computing shared geometry and warping images...")
-            root.update()
+            def compute(report):
+                """Merge the images and warp the grid. Runs on a worker thread, so no Tk calls here."""
+                # Resize to the warp resolution and scale lines to match (see
+                # set_alpha_and_run)
+                resized, scaled_line_sets, grid_lines = prepare_warp_sources(src_images, src_line_sets,
+                                                                             CANVAS_WIDTH, CANVAS_HEIGHT,
+                                                                             show_grid)
+                
+                # Perform multiple image merge
+                report("Computing shared geometry and warping images...")
+                
+                merged_image, warped_images, shared_lines = merge_multiple_images(
+                    list(resized),
+                    list(scaled_line_sets),
+                    weights,
+                    a=0.01, b=2.0, p=0.0
+                )
+                
+                warped_grids = None
+                if show_grid:
+                    report("Computing grid visualization...")
+                    
+                    # Warp grid from each image to shared geometry
+                    warped_grids = [warp_grid_points(grid_lines, lines, shared_lines,
+                                                     a=0.01, b=2.0, p=0.0, samples_per_line=20)
+                                    for lines in scaled_line_sets]
+                
+                return merged_image, warped_images, warped_grids
             
-            merged_image, warped_images, shared_lines = merge_multiple_images(
-                [image1_original, image2_original, image3_original],
-                [lines1_scaled, lines2_scaled, lines3_scaled],
-                weights,
-                a=0.01, b=2.0, p=0.0
-            )
+            run_in_background(compute, lambda result: show_merge_result(weights, len(src_line_sets[0]), *result),
+                              "Merge failed")
             
+        except Exception as e:
+            messagebox.showerror("Error", f"Merge failed: {str(e)}")
+            traceback.print_exc()
+            status_label.config(text="Merge failed - see error message")
+    
+    def show_merge_result(weights, num_lines, merged_image, warped_images, warped_grids):
+        """Display a finished merge (Tk thread)"""
+        try:
             # Display results with optional grid visualization
             # Show all 3 warped images AND the final blend in the 4 output canvases
-            if show_grid_var.get():
-                status_label.config(text="Computing grid visualization...")
-                root.update()
-                
-                # Generate grid for the image
-                target_size = image1_original.size
-                grid_lines = generate_grid(target_size[0], target_size[1], grid_spacing=30)
-                
-                # Warp grid from each image to shared geometry
-                warped_grid1 = warp_grid_points(grid_lines, lines1_scaled, shared_lines, 
-                                                a=0.01, b=2.0, p=0.0, samples_per_line=20)
-                warped_grid2 = warp_grid_points(grid_lines, lines2_scaled, shared_lines, 
-                                                a=0.01, b=2.0, p=0.0, samples_per_line=20)
-                warped_grid3 = warp_grid_points(grid_lines, lines3_scaled, shared_lines, 
-                                                a=0.01, b=2.0, p=0.0, samples_per_line=20)
+            if warped_grids is not None:
+                warped_grid1, warped_grid2, warped_grid3 = warped_grids
                 
                 # Display all 3 warped images with grid overlays
                 display_image_with_grid_overlay(warped_images[0], output1_canvas, warped_grid1, 
@@ -655,6 +760,7 @@ def main():
                 display_image_on_canvas(merged_image, output4_canvas, CANVAS_WIDTH, CANVAS_HEIGHT)
             
             # Normalize weights for display
+            t1, t2, t3 = weights
             weight_sum = t1 + t2 + t3
             if weight_sum > 0:
                 t1_norm = t1 / weight_sum
@@ -663,11 +769,10 @@ def main():
             else:
                 t1_norm = t2_norm = t3_norm = 1/3
             
-            status_label.config(text=f"Merge complete! Weights: [{t1_norm:.3f}, {t2_norm:.3f}, {t3_norm:.3f}], {len(lines_image1)} line triplets used")
+            status_label.config(text=f"Merge complete! Weights: [{t1_norm:.3f}, {t2_norm:.3f}, {t3_norm:.3f}], {num_lines} line triplets used")
             
         except Exception as e:
             messagebox.showerror("Error", f"Merge failed: {str(e)}")
-            import traceback
             traceback.print_exc()
             status_label.config(text="Merge failed - see error message")
     
@@ -3,10 +3,51 @@ Feature-Based Image Morphing Algorithm
 Implementation based on Beier & Neely (1992) SIGGRAPH paper
 """
 
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from PIL import Image
 
 
+# Image modes Image.blend can combine directly
+_BLEND_MODES = ("L", "LA", "RGB", "RGBA")
+
+# Images are warped in bands of rows of about this many pixels. A band's
+# work arrays stay in cache, and bands are independent, so they are spread
+# over threads (NumPy releases the GIL in the array operations).
+_BAND_PIXELS = 1 << 16
+_warp_threads = os.cpu_count() or 1
+_band_executor = None
+_band_executor_lock = threading.Lock()
+
+
+def _map_bands(band_fn, height, width):
+    """
+    Run band_fn(row_start, row_stop) over bands of rows covering height.
+    
+    Bands run on a shared thread pool when there is more than one CPU,
+    otherwise in order on the calling thread.
+    """
+    global _band_executor
+    rows = max(1, _BAND_PIXELS // max(width, 1))
+    bands = [(start, min(start + rows, height)) for start in range(0, height, rows)]
+    
+    if _warp_threads == 1 or len(bands) == 1:
+        for start, stop in bands:
+            band_fn(start, stop)
+        return
+    
+    with _band_executor_lock:
+        if _band_executor is None:
+            _band_executor = ThreadPoolExecutor(max_workers=_warp_threads)
+        executor = _band_executor
+    # list() waits for every band and re-raises the first error
+    list(executor.map(lambda band: band_fn(*band), bands))
+
+
 def compute_uv(X, P, Q):
     """
     Compute u and v coordinates for point X relative to line PQ.
@@ -21,24 +62,23 @@ def compute_uv(X, P, Q):
         u: Position along the line (0 to 1 from P to Q)
         v: Perpendicular distance from the line
     """
-    X = np.array(X, dtype=float)
-    P = np.array(P, dtype=float)
-    Q = np.array(Q, dtype=float)
-    
-    PQ = Q - P
-    length_PQ = np.linalg.norm(PQ)
+    # Plain float arithmetic: this handles one point, where building small
+    # NumPy arrays would cost far more than the math itself
+    x, y = float(X[0]), float(X[1])
+    p_x, p_y = float(P[0]), float(P[1])
+    pq_x, pq_y = float(Q[0]) - p_x, float(Q[1]) - p_y
+    length_PQ = math.hypot(pq_x, pq_y)
     
     if length_PQ < 1e-6:
         return 0.0, 0.0
     
-    # u = (X-P) · (Q-P) / ||Q-P||^2
-    u = np.dot(X - P, PQ) / (length_PQ ** 2)
+    px_x, px_y = x - p_x, y - p_y
     
-    # Perpendicular vector (rotate PQ by 90 degrees)
-    PQ_perp = np.array([-PQ[1], PQ[0]])
+    # u = (X-P) · (Q-P) / ||Q-P||^2
+    u = (px_x * pq_x + px_y * pq_y) / (length_PQ ** 2)
     
-    # v = (X-P) · Perpendicular(Q-P) / ||Q-P||
-    v = np.dot(X - P, PQ_perp) / length_PQ
+    # v = (X-P) · Perpendicular(Q-P) / ||Q-P||, Perpendicular(Q-P) = (-PQ_y, PQ_x)
+    v = (px_y * pq_x - px_x * pq_y) / length_PQ
     
     return u, v
 
@@ -57,25 +97,236 @@ def compute_X_prime(u, v, P_prime, Q_prime):
     Returns:
         X_prime: Corresponding point in source image [x, y]
     """
-    P_prime = np.array(P_prime, dtype=float)
-    Q_prime = np.array(Q_prime, dtype=float)
-    
-    PQ_prime = Q_prime - P_prime
-    length_PQ_prime = np.linalg.norm(PQ_prime)
+    p_x, p_y = float(P_prime[0]), float(P_prime[1])
+    pq_x, pq_y = float(Q_prime[0]) - p_x, float(Q_prime[1]) - p_y
+    length_PQ_prime = math.hypot(pq_x, pq_y)
     
     if length_PQ_prime < 1e-6:
-        return P_prime
-    
-    # Perpendicular vector
-    PQ_prime_perp = np.array([-PQ_prime[1], PQ_prime[0]])
-    PQ_prime_perp_normalized = PQ_prime_perp / length_PQ_prime
+        return np.array([p_x, p_y])
     
     # X' = P' + u(Q'-P') + v * Perpendicular(Q'-P') / ||Q'-P'||
-    X_prime = P_prime + u * PQ_prime + v * PQ_prime_perp_normalized
+    X_prime = np.array([p_x + u * pq_x - v * pq_y / length_PQ_prime,
+                        p_y + u * pq_y + v * pq_x / length_PQ_prime])
     
     return X_prime
 
 
+def _lines_to_array(lines, dtype=np.float32):
+    """
+    Convert a line set [((Px, Py), (Qx, Qy)), ...] to an (N, 2, 2) array.
+    
+    Arrays that already have the right dtype are returned without copying.
+    """
+    return np.asarray(lines, dtype=dtype).reshape(-1, 2, 2)
+
+
+def _map_points(X, Y, source_line_sets, dest_lines, a, b, p):
+    """
+    Map destination points X to source points X' with the multiple line algorithm.
+    
+    Same math as the per-pixel loop in the paper, but each line contributes
+    its displacement and weight for all points at once. Degenerate lines are
+    handled like compute_uv and compute_X_prime do.
+    
+    u, v and the weights depend only on the destination lines, so they are
+    computed once and shared by every source line set (e.g. both images of
+    a morph frame, which warp to the same interpolated lines). Work arrays
+    are reused across lines and updated in place, which keeps the loop
+    memory-bound on a handful of buffers instead of allocating new
+    temporaries for every term. Everything is computed in the dtype of X.
+    
+    Args:
+        X: Array of destination x coordinates
+        Y: Array of destination y coordinates (same shape as X)
+        source_line_sets: List of source feature line sets (P'Q'), one per output
+        dest_lines: Destination feature lines (PQ)
+        a, b, p: Warping parameters (see warp_image_with_lines)
+    
+    Returns:
+        List of (X_source, Y_source) array pairs with the shape of X, one per
+        source line set
+    """
+    dest_lines = _lines_to_array(dest_lines, X.dtype)
+    source_line_sets = [_lines_to_array(lines, X.dtype) for lines in source_line_sets]
+    
+    # Per-line quantities, computed for all lines at once. The divisions by
+    # ||Q-P|| and ||Q'-P'|| are folded into the direction vectors here, so
+    # the per-pixel work below is multiplies and adds only (degenerate lines
+    # get zero vectors and take the P' branch)
+    PQs = dest_lines[:, 1] - dest_lines[:, 0]
+    lengths = np.hypot(PQs[:, 0], PQs[:, 1])
+    inv_lengths = np.divide(1, lengths, out=np.zeros_like(lengths), where=lengths >= 1e-6)
+    u_dirs = PQs * (inv_lengths ** 2)[:, None]
+    v_dirs = np.stack([-PQs[:, 1], PQs[:, 0]], axis=1) * inv_lengths[:, None]
+    length_weights = lengths ** p
+    
+    PQs_prime = [lines[:, 1] - lines[:, 0] for lines in source_line_sets]
+    lengths_prime = [np.hypot(PQ_prime[:, 0], PQ_prime[:, 1]) for PQ_prime in PQs_prime]
+    normals_prime = [PQ_prime * np.divide(1, length_prime, out=np.zeros_like(length_prime),
+                                          where=length_prime >= 1e-6)[:, None]
+                     for PQ_prime, length_prime in zip(PQs_prime, lengths_prime)]
+    
+    DSUMs = [(np.zeros_like(X), np.zeros_like(X)) for _ in source_line_sets]
+    weightsum = np.zeros_like(X)
+    
+    # Work arrays reused for every line
+    PX_x = np.empty_like(X)
+    PX_y = np.empty_like(X)
+    u = np.empty_like(X)
+    v = np.empty_like(X)
+    weight = np.empty_like(X)
+    term = np.empty_like(X)
+    scratch = np.empty_like(X)
+    
+    for i, (P, Q) in enumerate(dest_lines):
+        u_dir = u_dirs[i]
+        v_dir = v_dirs[i]
+        np.subtract(X, P[0], out=PX_x)
+        np.subtract(Y, P[1], out=PX_y)
+        
+        degenerate = lengths[i] < 1e-6
+        if degenerate:
+            # u = v = 0, so X'i = P' and distance is measured to P
+            dist = np.hypot(PX_x, PX_y, out=weight)
+        else:
+            # Equations (1) and (2): u along PQ, v perpendicular to it
+            np.multiply(PX_x, u_dir[0], out=u)
+            u += np.multiply(PX_y, u_dir[1], out=term)
+            
+            np.multiply(PX_x, v_dir[0], out=v)
+            v += np.multiply(PX_y, v_dir[1], out=term)
+            
+            # Distance depends on u value (from paper note): |v| beside the
+            # segment, distance to the nearer endpoint beyond it
+            dist = np.abs(v, out=weight)
+            before = u < 0
+            dist[before] = np.hypot(PX_x[before], PX_y[before])
+            after = u > 1
+            dist[after] = np.hypot(X[after] - Q[0], Y[after] - Q[1])
+        
+        # Weight calculation (equation 4 from paper)
+        # weight = (length^p) / (a + dist)^b
+        dist += a
+        np.power(dist, b, out=weight)
+        np.divide(length_weights[i], weight, out=weight)
+        weightsum += weight
+        
+        for (DSUM_x, DSUM_y), source_lines, source_PQs, source_lengths, source_normals in zip(
+                DSUMs, source_line_sets, PQs_prime, lengths_prime, normals_prime):
+            P_prime = source_lines[i, 0]
+            PQ_prime = source_PQs[i]
+            length_PQ_prime = source_lengths[i]
+            normal_prime = source_normals[i]
+            
+            # Equation (3): X' = P' + u(Q'-P') + v * Perpendicular(Q'-P') / ||Q'-P'||,
+            # accumulated as the weighted displacement (X'i - X) * weight
+            if degenerate or length_PQ_prime < 1e-6:
+                np.subtract(P_prime[0], X, out=term)
+                term *= weight
+                DSUM_x += term
+                
+                np.subtract(P_prime[1], Y, out=term)
+                term *= weight
+                DSUM_y += term
+            else:
+                np.multiply(u, PQ_prime[0], out=term)
+                term += P_prime[0]
+                term -= np.multiply(v, normal_prime[1], out=scratch)
+                term -= X
+                term *= weight
+                DSUM_x += term
+                
+                np.multiply(u, PQ_prime[1], out=term)
+                term += P_prime[1]
+                term += np.multiply(v, normal_prime[0], out=scratch)
+                term -= Y
+                term *= weight
+                DSUM_y += term
+    
+    # X' = X + DSUM / weightsum (points with no weight stay in place)
+    has_weight = weightsum > 0
+    mapped = []
+    for DSUM_x, DSUM_y in DSUMs:
+        X_source = X + np.divide(DSUM_x, weightsum, out=np.zeros_like(X), where=has_weight)
+        Y_source = Y + np.divide(DSUM_y, weightsum, out=np.zeros_like(X), where=has_weight)
+        mapped.append((X_source, Y_source))
+    
+    return mapped
+
+
+def _sample_bilinear(src_array, X_source, Y_source):
+    """
+    Sample an image at fractional positions using bilinear interpolation.
+    
+    Positions are clamped to the image, so points outside it take the
+    colour of the nearest edge (like a replicated border).
+    Works like a remap: the four neighbour weights and flat pixel indices
+    are computed once, then each channel is gathered with np.take, which is
+    much faster than fancy indexing on the (H, W, C) array. The gathers read
+    the interleaved pixel buffer directly rather than copying out channel
+    planes.
+    
+    Args:
+        src_array: Source image array (H, W) or (H, W, C)
+        X_source: Array of x positions to sample
+        Y_source: Array of y positions to sample
+    
+    Returns:
+        Sampled array with the dtype of src_array
+    """
+    height, width = src_array.shape[:2]
+    
+    # Clamp to image bounds
+    src_x = np.clip(X_source, 0, width - 1)
+    src_y = np.clip(Y_source, 0, height - 1)
+    
+    # Top-left neighbour, kept one pixel inside the last row and column so
+    # all four neighbours always exist: a position on the last column gets
+    # dx == 1 and takes the right-hand pixels exactly, no edge case needed
+    x0 = src_x.astype(np.intp)
+    y0 = src_y.astype(np.intp)
+    np.minimum(x0, max(width - 2, 0), out=x0)
+    np.minimum(y0, max(height - 2, 0), out=y0)
+    
+    dx = src_x - x0
+    dy = src_y - y0
+    
+    # Flat indices of the four neighbours (a 1-pixel wide or high image has
+    # only one neighbour in that direction)
+    index00 = y0 * width + x0
+    index01 = index00 + (1 if width > 1 else 0)
+    index10 = index00 + (width if height > 1 else 0)
+    index11 = index10 + (1 if width > 1 else 0)
+    
+    weight00 = (1 - dx) * (1 - dy)
+    weight01 = dx * (1 - dy)
+    weight10 = (1 - dx) * dy
+    weight11 = dx * dy
+    
+    # Channel c of pixel i is element i * channels + c of the flat buffer,
+    # so each channel is the same gather on a view offset by c
+    channels = src_array.shape[2] if src_array.ndim == 3 else 1
+    flat = src_array.reshape(-1)
+    if channels > 1:
+        for index in (index00, index01, index10, index11):
+            index *= channels
+    
+    output_array = np.empty(X_source.shape + src_array.shape[2:], dtype=src_array.dtype)
+    output_channels = output_array.reshape(X_source.shape + (channels,))
+    for c in range(channels):
+        plane = flat[c:]
+        
+        # Interpolate
+        pixel = weight00 * np.take(plane, index00)
+        pixel += weight01 * np.take(plane, index01)
+        pixel += weight10 * np.take(plane, index10)
+        pixel += weight11 * np.take(plane, index11)
+        
+        output_channels[..., c] = pixel
+    
+    return output_array
+
+
 def warp_image_with_lines(src_image, source_lines, dest_lines, a=0.01, b=2.0, p=0.0):
     """
     Warp source image using field morphing algorithm.
@@ -83,6 +334,10 @@ def warp_image_with_lines(src_image, source_lines, dest_lines, a=0.01, b=2.0, p=
     From paper: "For each pixel X in the destination image, find the corresponding U,V
     based on destination lines PQ, then find X' in source image using source lines P'Q'."
     
+    Pixels are processed with NumPy a band of rows at a time (see
+    _map_bands); the only Python loops are over the bands and the feature
+    lines.
+    
     Args:
         src_image: PIL Image to warp
         source_lines: Lines defined relative to source image (P'Q' in paper)
@@ -96,99 +351,107 @@ def warp_image_with_lines(src_image, source_lines, dest_lines, a=0.01, b=2.0, p=
     Returns:
         Warped PIL Image
     """
-    # Convert PIL image to numpy array
-    src_array = np.array(src_image)
-    height, width = src_array.shape[:2]
+    # If no lines, just copy the image
+    if len(dest_lines) == 0:
+        return Image.fromarray(np.asarray(src_image))
     
-    # Create output image
-    output_array = np.zeros_like(src_array)
+    return warp_images_with_shared_dest([src_image], [source_lines], dest_lines, a, b, p)[0]
+
+
+def warp_pair_with_shared_dest(src_image1, src_image2, source_lines1, source_lines2, dest_lines,
+                               a=0.01, b=2.0, p=0.0):
+    """
+    Warp two source images onto the same destination lines.
     
-    # For each pixel X in destination image
-    for y in range(height):
-        for x in range(width):
-            X = np.array([x, y], dtype=float)
-            
-            # If no lines, just copy pixel
-            if len(dest_lines) == 0:
-                output_array[y, x] = src_array[y, x]
-                continue
-            
-            # Multiple line algorithm from paper
-            DSUM = np.array([0.0, 0.0])
-            weightsum = 0.0
-            
-            for i in range(len(dest_lines)):
-                # PQ = destination line, P'Q' = source line
-                P, Q = dest_lines[i]
-                P_prime, Q_prime = source_lines[i]
-                
-                # Calculate u, v based on destination line PQ
-                u, v = compute_uv(X, P, Q)
-                
-                # Calculate X'i based on u,v and source line P'Q'
-                X_prime_i = compute_X_prime(u, v, P_prime, Q_prime)
-                
-                # Displacement Di = X'i - X
-                D_i = X_prime_i - X
-                
-                # Calculate distance from X to destination line PQ
-                P_arr = np.array(P, dtype=float)
-                Q_arr = np.array(Q, dtype=float)
-                PQ = Q_arr - P_arr
-                length_PQ = np.linalg.norm(PQ)
-                
-                if length_PQ < 1e-6:
-                    dist = np.linalg.norm(X - P_arr)
-                else:
-                    # Distance depends on u value (from paper note)
-                    if u < 0:
-                        dist = np.linalg.norm(X - P_arr)
-                    elif u > 1:
-                        dist = np.linalg.norm(X - Q_arr)
-                    else:
-                        dist = abs(v)
-                
-                # Weight calculation (equation 4 from paper)
-                # weight = (length^p) / (a + dist)^b
-                weight = (length_PQ ** p) / ((a + dist) ** b)
-                
-                DSUM += D_i * weight
-                weightsum += weight
-            
-            # Calculate final source position: X' = X + DSUM / weightsum
-            if weightsum > 0:
-                X_source = X + DSUM / weightsum
-            else:
-                X_source = X
-            
-            # Sample from source image using bilinear interpolation
-            src_x, src_y = X_source[0], X_source[1]
-            
-            # Clamp to image bounds
-            src_x = max(0, min(width - 1, src_x))
-            src_y = max(0, min(height - 1, src_y))
-            
-            # Check if we can do bilinear interpolation
-            if 0 <= src_x < width - 1 and 0 <= src_y < height - 1:
-                # Bilinear interpolation
-                x0, y0 = int(src_x), int(src_y)
-                x1, y1 = x0 + 1, y0 + 1
-                
-                dx = src_x - x0
-                dy = src_y - y0
-                
-                # Interpolate
-                pixel = (1 - dx) * (1 - dy) * src_array[y0, x0] + \
-                        dx * (1 - dy) * src_array[y0, x1] + \
-                        (1 - dx) * dy * src_array[y1, x0] + \
-                        dx * dy * src_array[y1, x1]
-                
-                output_array[y, x] = pixel.astype(np.uint8)
-            else:
-                # Edge case: just copy nearest pixel
-                output_array[y, x] = src_array[int(src_y), int(src_x)]
+    Equivalent to two warp_image_with_lines calls, but the destination-side
+    terms (u, v and line weights per pixel) are computed only once. This is
+    the case for every morph frame, where both images warp to the
+    interpolated lines.
     
-    return Image.fromarray(output_array)
+    Args:
+        src_image1: First PIL Image to warp
+        src_image2: Second PIL Image to warp (same size as src_image1)
+        source_lines1: Lines defined relative to src_image1
+        source_lines2: Lines defined relative to src_image2
+        dest_lines: Lines defined relative to the shared destination
+        a, b, p: Warping parameters (see warp_image_with_lines)
+    
+    Returns:
+        Tuple: (warped1, warped2) PIL Images
+    """
+    return tuple(warp_images_with_shared_dest([src_image1, src_image2], [source_lines1, source_lines2],
+                                              dest_lines, a, b, p))
+
+
+def warp_images_with_shared_dest(src_images, source_line_sets, dest_lines, a=0.01, b=2.0, p=0.0):
+    """
+    Warp any number of same-size source images onto the same destination lines.
+    
+    The general form of warp_pair_with_shared_dest, e.g. for merging several
+    images onto their shared geometry.
+    
+    Args:
+        src_images: List of PIL Images to warp, all the same size
+        source_line_sets: Lines defined relative to each source image
+        dest_lines: Lines defined relative to the shared destination
+        a, b, p: Warping parameters (see warp_image_with_lines)
+    
+    Returns:
+        List of warped PIL Images, one per source image
+    """
+    if len(dest_lines) == 0:
+        return [warp_image_with_lines(image, lines, dest_lines, a, b, p)
+                for image, lines in zip(src_images, source_line_sets)]
+    
+    warped_arrays, _ = _warp_images(src_images, source_line_sets, dest_lines, a, b, p)
+    return [Image.fromarray(warped_array) for warped_array in warped_arrays]
+
+
+def _warp_images(src_images, source_line_sets, dest_lines, a, b, p, blend_weights=None):
+    """
+    Band-parallel body of warp_images_with_shared_dest (dest_lines non-empty).
+    
+    With blend_weights, each band of the warped images is also blended into a
+    weighted sum while it is still in cache, which saves blend_multiple_images
+    a second pass over every warped image.
+    
+    Returns:
+        Tuple: (warped uint8 arrays, blended uint8 array or None)
+    """
+    # Convert the lines once here rather than again in every band
+    source_line_sets = [_lines_to_array(lines) for lines in source_line_sets]
+    dest_lines = _lines_to_array(dest_lines)
+    
+    # Read-only arrays of the PIL image data (np.array would copy them a second time)
+    src_arrays = [np.asarray(image) for image in src_images]
+    height, width = src_arrays[0].shape[:2]
+    output_arrays = [np.empty_like(src_array) for src_array in src_arrays]
+    blended_array = None if blend_weights is None else np.empty_like(src_arrays[0])
+    
+    # Coordinates of the pixels X in destination image (float32 is ample for
+    # pixel positions and halves the memory traffic of the field computation)
+    xs = np.arange(width, dtype=np.float32)
+    
+    def warp_band(start, stop):
+        X, Y = np.meshgrid(xs, np.arange(start, stop, dtype=np.float32))
+        mapped = _map_points(X, Y, source_line_sets, dest_lines, a, b, p)
+        
+        # Sample from source images using bilinear interpolation
+        for src_array, output_array, (X_source, Y_source) in zip(src_arrays, output_arrays, mapped):
+            output_array[start:stop] = _sample_bilinear(src_array, X_source, Y_source)
+        
+        if blend_weights is not None:
+            # Same float32 accumulation as blend_multiple_images
+            blended = np.zeros(output_arrays[0][start:stop].shape, dtype=np.float32)
+            term = np.empty_like(blended)
+            for output_array, weight in zip(output_arrays, blend_weights):
+                np.multiply(output_array[start:stop], np.float32(weight), out=term)
+                blended += term
+            blended_array[start:stop] = blended
+    
+    _map_bands(warp_band, height, width)
+    
+    return output_arrays, blended_array
 
 
 def interpolate_lines(lines1, lines2, alpha):
@@ -201,17 +464,30 @@ def interpolate_lines(lines1, lines2, alpha):
         alpha: Interpolation parameter (0 = lines1, 1 = lines2)
     
     Returns:
-        Interpolated lines
+        Interpolated lines as a float32 array of shape (N, 2, 2)
     """
-    lines_interp = []
-    for i in range(len(lines1)):
-        P1, Q1 = lines1[i]
-        P2, Q2 = lines2[i]
-        
-        P_interp = ((1-alpha)*P1[0] + alpha*P2[0], (1-alpha)*P1[1] + alpha*P2[1])
-        Q_interp = ((1-alpha)*Q1[0] + alpha*Q2[0], (1-alpha)*Q1[1] + alpha*Q2[1])
-        
-        lines_interp.append((P_interp, Q_interp))
+    return interpolate_lines_batch(lines1, lines2, [alpha])[0]
+
+
+def interpolate_lines_batch(lines1, lines2, alphas):
+    """
+    Interpolate between two sets of lines at several alphas at once.
+    
+    Args:
+        lines1: First set of lines [((p_x, p_y), (q_x, q_y)), ...]
+        lines2: Second set of lines [((p_x, p_y), (q_x, q_y)), ...]
+        alphas: Sequence of K interpolation parameters (0 = lines1, 1 = lines2)
+    
+    Returns:
+        Interpolated lines as a float32 array of shape (K, N, 2, 2)
+    """
+    lines1 = np.asarray(lines1, dtype=np.float32).reshape(-1, 2, 2)
+    lines2 = np.asarray(lines2, dtype=np.float32).reshape(-1, 2, 2)
+    alphas = np.asarray(alphas, dtype=np.float32).reshape(-1, 1, 1, 1)
+    
+    # Weighted form (rather than lines1 + alpha * delta) gives exactly
+    # lines1 at alpha=0 and exactly lines2 at alpha=1
+    lines_interp = (1 - alphas) * lines1 + alphas * lines2
     
     return lines_interp
 
@@ -228,10 +504,19 @@ def blend_images(img1, img2, alpha):
     Returns:
         Blended PIL Image
     """
-    arr1 = np.array(img1, dtype=float)
-    arr2 = np.array(img2, dtype=float)
-    
-    blended_arr = (1 - alpha) * arr1 + alpha * arr2
+    # Pillow's C blend computes the same weighted sum in a single pass
+    # without float64 temporaries; it needs matching 8-bit images
+    if img1.mode == img2.mode and img1.size == img2.size and img1.mode in _BLEND_MODES:
+        # The endpoints are just the inputs
+        if alpha == 0:
+            return img1.copy()
+        if alpha == 1:
+            return img2.copy()
+        return Image.blend(img1, img2, alpha)
+    
+    # float32 is ample for 8-bit pixels and halves the temporaries
+    blended_arr = np.multiply(np.asarray(img1), np.float32(1 - alpha), dtype=np.float32)
+    blended_arr += np.multiply(np.asarray(img2), np.float32(alpha), dtype=np.float32)
     
     return Image.fromarray(blended_arr.astype(np.uint8))
 
@@ -264,13 +549,13 @@ def blend_multiple_images(images, weights):
         # If all weights are 0, use equal weights
         weights = np.ones(len(weights)) / len(weights)
     
-    # Convert images to arrays and blend
-    arrays = [np.array(img, dtype=float) for img in images]
-    
-    # Weighted sum
-    blended_arr = np.zeros_like(arrays[0], dtype=float)
-    for i, (arr, weight) in enumerate(zip(arrays, weights)):
-        blended_arr += weight * arr
+    # Weighted sum, accumulated in float32 (ample for 8-bit pixels) one
+    # image at a time instead of converting every image up front
+    blended_arr = np.zeros(np.asarray(images[0]).shape, dtype=np.float32)
+    term = np.empty_like(blended_arr)
+    for img, weight in zip(images, weights):
+        np.multiply(np.asarray(img), np.float32(weight), out=term)
+        blended_arr += term
     
     return Image.fromarray(blended_arr.astype(np.uint8))
 
@@ -286,7 +571,8 @@ def interpolate_multiple_lines(line_sets, weights):
         weights: List of weights (should sum to 1.0), one per line set
     
     Returns:
-        Interpolated lines representing the shared geometry
+        Interpolated lines representing the shared geometry, as an array
+        of shape (N, 2, 2)
     """
     if len(line_sets) == 0:
         raise ValueError("Need at least one line set")
@@ -308,19 +594,10 @@ def interpolate_multiple_lines(line_sets, weights):
         if len(line_set) != num_lines:
             raise ValueError("All line sets must have the same number of lines")
     
-    # Interpolate each line
-    shared_lines = []
-    for line_idx in range(num_lines):
-        # Weighted average of P points
-        P_avg = np.zeros(2, dtype=float)
-        Q_avg = np.zeros(2, dtype=float)
-        
-        for line_set, weight in zip(line_sets, weights):
-            P, Q = line_set[line_idx]
-            P_avg += weight * np.array(P)
-            Q_avg += weight * np.array(Q)
-        
-        shared_lines.append((tuple(P_avg), tuple(Q_avg)))
+    # Weighted average of all P and Q points at once
+    shared_lines = np.zeros((num_lines, 2, 2), dtype=float)
+    for line_set, weight in zip(line_sets, weights):
+        shared_lines += weight * np.asarray(line_set, dtype=float).reshape(-1, 2, 2)
     
     return shared_lines
 
@@ -367,14 +644,13 @@ def merge_multiple_images(images, line_sets, weights, a=0.01, b=2.0, p=0.0):
     
     for i in range(1, len(images)):
         if images[i].size != target_size:
-            resized_img = images[i].resize(target_size, Image.Resampling.LANCZOS)
+            resized_img = images[i].resize(target_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
             resized_images.append(resized_img)
             
-            # Scale the feature lines accordingly
-            scale_x = target_size[0] / images[i].size[0]
-            scale_y = target_size[1] / images[i].size[1]
-            scaled_lines = [((p[0]*scale_x, p[1]*scale_y), (q[0]*scale_x, q[1]*scale_y)) 
-                           for p, q in line_sets[i]]
+            # Scale the feature lines accordingly (broadcasts over both endpoints)
+            scale = np.array([target_size[0] / images[i].size[0],
+                              target_size[1] / images[i].size[1]])
+            scaled_lines = np.asarray(line_sets[i], dtype=float).reshape(-1, 2, 2) * scale
             adjusted_line_sets.append(scaled_lines)
         else:
             resized_images.append(images[i])
@@ -383,14 +659,20 @@ def merge_multiple_images(images, line_sets, weights, a=0.01, b=2.0, p=0.0):
     # Step 1: Compute shared geometry (barycentric interpolation of feature lines)
     shared_lines = interpolate_multiple_lines(adjusted_line_sets, weights)
     
-    # Step 2: Warp each image to the shared geometry
-    warped_images = []
-    for i, (img, lines) in enumerate(zip(resized_images, adjusted_line_sets)):
-        warped_img = warp_image_with_lines(img, lines, shared_lines, a=a, b=b, p=p)
-        warped_images.append(warped_img)
-    
-    # Step 3: Blend the warped images using barycentric weights
-    merged_image = blend_multiple_images(warped_images, weights)
+    if len(shared_lines) == 0:
+        # Nothing to warp by: the images pass through and are blended as-is
+        warped_images = warp_images_with_shared_dest(resized_images, adjusted_line_sets, shared_lines,
+                                                     a=a, b=b, p=p)
+        return blend_multiple_images(warped_images, weights), warped_images, shared_lines
+    
+    # Steps 2 and 3: Warp each image to the shared geometry (all images are
+    # the same size now, so the destination-side terms are computed once for
+    # all) and blend the warped images with the barycentric weights, band by
+    # band in the same pass
+    warped_arrays, merged_array = _warp_images(resized_images, adjusted_line_sets, shared_lines,
+                                               a, b, p, blend_weights=weights)
+    warped_images = [Image.fromarray(warped_array) for warped_array in warped_arrays]
+    merged_image = Image.fromarray(merged_array)
     
     return merged_image, warped_images, shared_lines
 
@@ -405,23 +687,49 @@ def generate_grid(width, height, grid_spacing=20):
         grid_spacing: Spacing between grid lines in pixels
     
     Returns:
-        List of grid lines as [((x1, y1), (x2, y2)), ...]
+        Grid lines as a float32 array of shape (N, 2, 2), horizontal lines
+        (top to bottom) followed by vertical lines (left to right)
     """
-    grid_lines = []
+    ys = np.arange(0, height + 1, grid_spacing, dtype=np.float32)
+    xs = np.arange(0, width + 1, grid_spacing, dtype=np.float32)
     
-    # Horizontal lines
-    y = 0
-    while y <= height:
-        grid_lines.append(((0, y), (width, y)))
-        y += grid_spacing
+    # Horizontal lines from (0, y) to (width, y)
+    horizontal = np.zeros((len(ys), 2, 2), dtype=np.float32)
+    horizontal[:, 1, 0] = width
+    horizontal[:, :, 1] = ys[:, np.newaxis]
     
-    # Vertical lines
-    x = 0
-    while x <= width:
-        grid_lines.append(((x, 0), (x, height)))
-        x += grid_spacing
+    # Vertical lines from (x, 0) to (x, height)
+    vertical = np.zeros((len(xs), 2, 2), dtype=np.float32)
+    vertical[:, :, 0] = xs[:, np.newaxis]
+    vertical[:, 1, 1] = height
     
-    return grid_lines
+    return np.concatenate([horizontal, vertical])
+
+
+def _grid_sample_points(grid_lines, samples_per_line):
+    """
+    Sample points along each grid line.
+    
+    Args:
+        grid_lines: List of grid lines [((x1, y1), (x2, y2)), ...]
+        samples_per_line: Number of segments per grid line
+    
+    Returns:
+        (X, Y) arrays of shape (num_grid_lines, samples_per_line + 1)
+    """
+    grid = np.asarray(grid_lines, dtype=float).reshape(-1, 2, 2)
+    t = np.arange(samples_per_line + 1) / samples_per_line
+    
+    # Interpolate along the grid line
+    X = grid[:, 0, 0, np.newaxis] * (1 - t) + grid[:, 1, 0, np.newaxis] * t
+    Y = grid[:, 0, 1, np.newaxis] * (1 - t) + grid[:, 1, 1, np.newaxis] * t
+    
+    return X, Y
+
+
+def _as_polylines(X, Y):
+    """Convert (num_lines, num_points) coordinate arrays to [[(x, y), ...], ...]."""
+    return [list(zip(xs, ys)) for xs, ys in zip(X.tolist(), Y.tolist())]
 
 
 def warp_grid_points(grid_lines, source_lines, dest_lines, a=0.01, b=2.0, p=0.0, samples_per_line=20):
@@ -440,76 +748,47 @@ def warp_grid_points(grid_lines, source_lines, dest_lines, a=0.01, b=2.0, p=0.0,
         List of warped grid lines [[(x1, y1), (x2, y2), ...], ...]
         Each line is a list of points showing the warped path
     """
-    warped_grid_lines = []
+    if len(grid_lines) == 0:
+        return []
     
-    for grid_line in grid_lines:
-        P_grid, Q_grid = grid_line
-        warped_points = []
-        
-        # Sample points along the grid line
-        for i in range(samples_per_line + 1):
-            t = i / samples_per_line
-            # Interpolate along the grid line
-            x = P_grid[0] * (1 - t) + Q_grid[0] * t
-            y = P_grid[1] * (1 - t) + Q_grid[1] * t
-            
-            X = np.array([x, y], dtype=float)
-            
-            # Apply the same warping algorithm as for pixels
-            if len(dest_lines) == 0:
-                warped_points.append((x, y))
-                continue
-            
-            # Multiple line algorithm
-            DSUM = np.array([0.0, 0.0])
-            weightsum = 0.0
-            
-            for i in range(len(dest_lines)):
-                P, Q = dest_lines[i]
-                P_prime, Q_prime = source_lines[i]
-                
-                # Calculate u, v based on destination line
-                u, v = compute_uv(X, P, Q)
-                
-                # Calculate X'i based on u,v and source line
-                X_prime_i = compute_X_prime(u, v, P_prime, Q_prime)
-                
-                # Displacement Di = X'i - X
-                D_i = X_prime_i - X
-                
-                # Calculate distance from X to destination line
-                P_arr = np.array(P, dtype=float)
-                Q_arr = np.array(Q, dtype=float)
-                PQ = Q_arr - P_arr
-                length_PQ = np.linalg.norm(PQ)
-                
-                if length_PQ < 1e-6:
-                    dist = np.linalg.norm(X - P_arr)
-                else:
-                    if u < 0:
-                        dist = np.linalg.norm(X - P_arr)
-                    elif u > 1:
-                        dist = np.linalg.norm(X - Q_arr)
-                    else:
-                        dist = abs(v)
-                
-                # Weight calculation
-                weight = (length_PQ ** p) / ((a + dist) ** b)
-                
-                DSUM += D_i * weight
-                weightsum += weight
-            
-            # Calculate final warped position
-            if weightsum > 0:
-                X_warped = X + DSUM / weightsum
-            else:
-                X_warped = X
-            
-            warped_points.append((X_warped[0], X_warped[1]))
-        
-        warped_grid_lines.append(warped_points)
+    X, Y = _grid_sample_points(grid_lines, samples_per_line)
     
-    return warped_grid_lines
-
+    # Apply the same warping algorithm as for pixels
+    X_warped, Y_warped = _map_points(X, Y, [source_lines], dest_lines, a, b, p)[0]
+    
+    return _as_polylines(X_warped, Y_warped)
 
 
+def warp_grid_pair_with_shared_dest(grid_lines, source_lines1, source_lines2, dest_lines,
+                                    a=0.01, b=2.0, p=0.0, samples_per_line=20):
+    """
+    Warp grid line points for two source line sets onto the same destination lines.
+    
+    Equivalent to two warp_grid_points calls, sharing the destination-side
+    terms like warp_pair_with_shared_dest does. A source line set equal to
+    dest_lines (alpha 0 or 1 of a morph) leaves its grid unwarped.
+    
+    Args:
+        grid_lines: List of grid lines [((x1, y1), (x2, y2)), ...]
+        source_lines1: First source feature lines
+        source_lines2: Second source feature lines
+        dest_lines: Destination feature lines
+        a, b, p: Warping parameters (same as warp_image_with_lines)
+        samples_per_line: Number of sample points per grid line for smooth curves
+    
+    Returns:
+        Tuple: (warped_grid1, warped_grid2) in the warp_grid_points format
+    """
+    if len(grid_lines) == 0:
+        return [], []
+    
+    X, Y = _grid_sample_points(grid_lines, samples_per_line)
+    
+    # Only map the points for line sets that actually move
+    dest = np.asarray(dest_lines, dtype=np.float64)
+    source_sets = [source_lines1, source_lines2]
+    moving = [lines for lines in source_sets if not np.array_equal(dest, lines)]
+    mapped = iter(_map_points(X, Y, moving, dest_lines, a, b, p) if moving else [])
+    
+    return tuple(_as_polylines(X, Y) if np.array_equal(dest, lines) else _as_polylines(*next(mapped))
+                 for lines in source_sets)
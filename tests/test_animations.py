@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import animations
+
+
+def _produce_frames(create_animation, *args, **kwargs):
+    """Start an animation and run its frame producer on this thread, returning the emitted frames."""
+    with mock.patch.object(animations, "_run_in_background") as run_in_background:
+        create_animation(*args, **kwargs)
+    compute = run_in_background.call_args[0][2]
+    frames = []
+    compute(lambda text: None, frames.append)
+    return frames
+
+
+class WarpAnimationTest(unittest.TestCase):
+    def test_playback_animates_the_warp_canvases(self):
+        gradient = np.tile(np.arange(0, 240, 10, dtype=np.uint8), (16, 1))
+        images = [Image.fromarray(np.dstack([gradient] * 3)), Image.fromarray(np.dstack([gradient[:, ::-1]] * 3))]
+        lines = [[((4, 3), (8, 12))], [((16, 3), (20, 12))]]
+        root = mock.MagicMock()
+        canvases = [mock.MagicMock() for _ in range(4)]
+        shown = {canvas: [] for canvas in canvases}
+
+        def run_in_background(root, status_label, compute, on_item, on_done, cancel_event, error_message):
+            compute(lambda text: None, on_item)
+            on_done()
+
+        # Photos are the frame pixels themselves, so no Tk root is needed
+        with mock.patch.object(animations, "_run_in_background", run_in_background), \
+                mock.patch.object(animations, "_frame_photo",
+                                  lambda photo_cache, key, image, *args: np.array(image)), \
+                mock.patch.object(animations, "show_photo_on_canvas",
+                                  lambda canvas, photo: shown[canvas].append(photo)):
+            animations.create_warp_animation(root, mock.MagicMock(), *canvases, *images, *lines, False, 24, 16)
+            for _ in range(5):
+                root.after.call_args[0][1]()
+
+        for canvas in canvases[:2]:
+            self.assertGreater(len(shown[canvas]), 1)
+            self.assertFalse(all(np.array_equal(shown[canvas][0], photo) for photo in shown[canvas][1:]))
+
+
+class SequentialAnimationTest(unittest.TestCase):
+    def test_frames_blend_their_warps_at_each_alpha(self):
+        images = [Image.new("RGB", (24, 16), (value, value, value)) for value in (0, 200, 100)]
+        lines = [[((2 + k, 3), (20, 12 - k))] for k in range(3)]
+        canvases = [mock.MagicMock() for _ in range(4)]
+
+        frames = _produce_frames(animations.create_sequential_animation, mock.MagicMock(), mock.MagicMock(),
+                                 *canvases, *images, *lines, True, 24, 16)
+
+        # 1→2, then 2→3 without repeating image 2
+        alpha_steps = np.linspace(0.0, 1.0, 11)
+        expected_alphas = np.concatenate([alpha_steps, alpha_steps[1:]])
+        self.assertEqual(len(frames), len(expected_alphas))
+
+        for i, (frame, expected_alpha) in enumerate(zip(frames, expected_alphas)):
+            alpha, warped1, warped2, warped3, blended = frame[:5]
+            self.assertAlmostEqual(alpha, expected_alpha)
+
+            warped_a, warped_b = (warped1, warped2) if i < len(alpha_steps) else (warped2, warped3)
+            expected = ((1 - expected_alpha) * np.asarray(warped_a, dtype=float) +
+                        expected_alpha * np.asarray(warped_b, dtype=float))
+            np.testing.assert_allclose(np.asarray(blended, dtype=float), expected, atol=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
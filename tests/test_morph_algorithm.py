@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morph_algorithm import _sample_bilinear
+
+
+def _reference_sample(src_array, x, y):
+    """Per-pixel bilinear sampling with a replicated border."""
+    height, width = src_array.shape[:2]
+    x = max(0, min(width - 1, x))
+    y = max(0, min(height - 1, y))
+    x0, y0 = min(int(x), width - 2), min(int(y), height - 2)
+    dx, dy = x - x0, y - y0
+    pixel = ((1 - dx) * (1 - dy) * src_array[y0, x0].astype(float) +
+             dx * (1 - dy) * src_array[y0, x0 + 1] +
+             (1 - dx) * dy * src_array[y0 + 1, x0] +
+             dx * dy * src_array[y0 + 1, x0 + 1])
+    return pixel.astype(src_array.dtype)
+
+
+class SampleBilinearTest(unittest.TestCase):
+    def test_matches_reference_including_edges(self):
+        rng = np.random.default_rng(0)
+        for shape in ((9, 13, 3), (9, 13)):
+            src_array = rng.integers(0, 256, shape, dtype=np.uint8)
+            height, width = shape[:2]
+
+            # Quarter-pixel positions (exact in float32) covering the
+            # interior, the last row and column, and points outside
+            xs = np.arange(-1, width + 1, 0.25, dtype=np.float32)
+            ys = np.arange(-1, height + 1, 0.25, dtype=np.float32)
+            X, Y = np.meshgrid(xs, ys)
+
+            sampled = _sample_bilinear(src_array, X, Y)
+            expected = np.array([[_reference_sample(src_array, float(x), float(y)) for x in xs]
+                                 for y in ys])
+            np.testing.assert_array_equal(sampled, expected)
+
+    def test_last_row_interpolates_along_the_row(self):
+        src_array = np.zeros((4, 4), dtype=np.uint8)
+        src_array[3] = [0, 100, 200, 40]
+
+        X = np.array([0.5, 1.5, 2.5, 3.0], dtype=np.float32)
+        Y = np.full(4, 3.0, dtype=np.float32)
+        np.testing.assert_array_equal(_sample_bilinear(src_array, X, Y), [50, 150, 120, 40])
+
+
+if __name__ == "__main__":
+    unittest.main()
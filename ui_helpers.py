@@ -3,7 +3,150 @@ UI Helper Functions for Image Morphing Application
 """
 
 import tkinter as tk
-from PIL import Image, ImageTk
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
+
+
+# PhotoImages of the source images shown under the feature lines, keyed by
+# (id(image), canvas size). Each entry also holds the image so its id() cannot be reused.
+_source_photo_cache = {}
+_SOURCE_PHOTO_CACHE_SIZE = 6
+
+# Filter for scaling images to the canvas. Pillow's BILINEAR is antialiased
+# when downscaling, so at preview size it looks like LANCZOS at a third of the cost.
+_DISPLAY_RESAMPLE = Image.Resampling.BILINEAR
+
+
+def render_grid_overlay(image, warped_grid_lines, canvas_width, canvas_height, color="cyan", width=1):
+    """
+    Render an image at canvas size with warped grid lines drawn into it.
+    
+    Produces the same picture as display_image_with_grid_overlay, but as a
+    single image, so it can be converted to a PhotoImage once and reused.
+    
+    Args:
+        image: PIL Image the grid belongs to
+        warped_grid_lines: List of warped grid lines, each is a list of points [(x1, y1), (x2, y2), ...]
+        canvas_width: Width of canvas
+        canvas_height: Height of canvas
+        color: Color of grid lines (default: cyan)
+        width: Width of grid lines (default: 1)
+    
+    Returns:
+        PIL Image of size (canvas_width, canvas_height)
+    """
+    img_resized = image.resize((canvas_width, canvas_height), _DISPLAY_RESAMPLE)
+    if img_resized.mode not in ("RGB", "RGBA"):
+        img_resized = img_resized.convert("RGB")
+    
+    # Scale factor from image coordinates to canvas coordinates
+    scale_x = canvas_width / image.size[0]
+    scale_y = canvas_height / image.size[1]
+    
+    draw = ImageDraw.Draw(img_resized)
+    for warped_line in warped_grid_lines:
+        points = [(x * scale_x, y * scale_y) for x, y in warped_line]
+        draw.line(points, fill=color, width=width)
+    
+    return img_resized
+
+
+def photo_for_canvas(image, canvas_width=400, canvas_height=300, warped_grid_lines=None, grid_color="cyan"):
+    """
+    Convert an image to a PhotoImage scaled to the canvas size.
+    
+    Args:
+        image: PIL Image to convert
+        canvas_width: Width of canvas
+        canvas_height: Height of canvas
+        warped_grid_lines: Optional warped grid lines to draw into the image
+        grid_color: Color of grid lines
+    
+    Returns:
+        ImageTk.PhotoImage ready to be shown on a canvas
+    """
+    return ImageTk.PhotoImage(_image_for_canvas(image, canvas_width, canvas_height, warped_grid_lines, grid_color))
+
+
+def _image_for_canvas(image, canvas_width, canvas_height, warped_grid_lines=None, grid_color="cyan"):
+    """Scale an image to the canvas size, drawing the grid into it if given (see photo_for_canvas)."""
+    if warped_grid_lines:
+        return render_grid_overlay(image, warped_grid_lines, canvas_width, canvas_height,
+                                   color=grid_color, width=1)
+    
+    return image.resize((canvas_width, canvas_height), _DISPLAY_RESAMPLE)
+
+
+def _reusable_canvas_photo(canvas, img_resized):
+    """
+    Copy a canvas-sized image into the PhotoImage the canvas owns for results.
+    
+    Pasting into an existing PhotoImage skips creating a Tk image for every
+    result shown. Only display_image_on_canvas and
+    display_image_with_grid_overlay use this photo; PhotoImages from
+    photo_for_canvas may be cached or shared and are never overwritten.
+    
+    Args:
+        canvas: tkinter Canvas widget
+        img_resized: PIL Image at canvas size
+    
+    Returns:
+        ImageTk.PhotoImage showing img_resized
+    """
+    photo = getattr(canvas, "result_photo", None)
+    if photo is None or (photo.width(), photo.height()) != img_resized.size:
+        photo = ImageTk.PhotoImage(img_resized)
+        canvas.result_photo = photo
+    else:
+        photo.paste(img_resized)
+    return photo
+
+
+def _cached_source_photo(image, canvas_width, canvas_height):
+    """
+    Get the canvas-size PhotoImage of a source image, building it on first use.
+    
+    Args:
+        image: PIL Image to convert
+        canvas_width: Width of canvas
+        canvas_height: Height of canvas
+    
+    Returns:
+        ImageTk.PhotoImage
+    """
+    key = (id(image), canvas_width, canvas_height)
+    entry = _source_photo_cache.get(key)
+    if entry is not None:
+        return entry[1]
+    
+    if len(_source_photo_cache) >= _SOURCE_PHOTO_CACHE_SIZE:
+        del _source_photo_cache[next(iter(_source_photo_cache))]
+    photo = photo_for_canvas(image, canvas_width, canvas_height)
+    _source_photo_cache[key] = (image, photo)
+    return photo
+
+
+def show_photo_on_canvas(canvas, photo):
+    """
+    Show a prepared PhotoImage on a canvas.
+    
+    The canvas keeps a single image item that is reconfigured in place,
+    so repeated calls (e.g. animation playback) do not recreate items.
+    
+    Args:
+        canvas: tkinter Canvas widget
+        photo: PhotoImage to show (see photo_for_canvas)
+    """
+    item = getattr(canvas, "photo_item", None)
+    
+    # The item is gone if the canvas was cleared with delete("all")
+    if item is None or canvas.type(item) != "image":
+        item = canvas.create_image(0, 0, anchor=tk.NW, image=photo)
+        canvas.photo_item = item
+    else:
+        canvas.itemconfigure(item, image=photo)
+    
+    canvas.image = photo  # Keep reference
 
 
 def display_image_on_canvas(image, canvas, canvas_width=400, canvas_height=300):
@@ -17,12 +160,15 @@ def display_image_on_canvas(image, canvas, canvas_width=400, canvas_height=300):
         canvas_height: Height of canvas
     """
     # Resize image to fit canvas
-    img_resized = image.resize((canvas_width, canvas_height), Image.Resampling.LANCZOS)
-    photo = ImageTk.PhotoImage(img_resized)
-    
+    img_resized = _image_for_canvas(image, canvas_width, canvas_height)
+    _replace_canvas_contents(canvas, _reusable_canvas_photo(canvas, img_resized))
+
+
+def _replace_canvas_contents(canvas, photo):
+    """Clear a canvas and show photo as its only item."""
     canvas.delete("all")
-    canvas.create_image(0, 0, anchor=tk.NW, image=photo)
-    canvas.image = photo  # Keep reference
+    canvas.drawn_lines = []
+    show_photo_on_canvas(canvas, photo)
 
 
 def draw_arrow_on_canvas(canvas, p, q, line_number):
@@ -56,6 +202,10 @@ def redraw_canvas_with_lines(canvas, image, lines, canvas_width=400, canvas_heig
     """
     Redraw canvas with image and all lines.
     
+    Canvas items are kept between calls: when lines only gained new entries
+    since the last redraw, just those arrows are drawn. Anything else (lines
+    cleared or replaced, canvas wiped) redraws from scratch.
+    
     Args:
         canvas: tkinter Canvas widget
         image: PIL Image to display
@@ -67,12 +217,23 @@ def redraw_canvas_with_lines(canvas, image, lines, canvas_width=400, canvas_heig
     if image is None:
         return
     
-    # Display image
-    display_image_on_canvas(image, canvas, canvas_width, canvas_height)
+    # Display image (the same images are redrawn after every line, so their
+    # PhotoImages are cached)
+    photo = _cached_source_photo(image, canvas_width, canvas_height)
+    
+    drawn = getattr(canvas, "drawn_lines", [])
+    item = getattr(canvas, "photo_item", None)
+    if item is None or canvas.type(item) != "image" or lines[:len(drawn)] != drawn:
+        canvas.delete("all")
+        drawn = []
+    show_photo_on_canvas(canvas, photo)
+    canvas.delete("preview")
     
-    # Draw all lines
-    for i, (p, q) in enumerate(lines):
+    # Draw the lines not on the canvas yet
+    for i in range(len(drawn), len(lines)):
+        p, q = lines[i]
         draw_arrow_on_canvas(canvas, p, q, i + 1)
+    canvas.drawn_lines = list(lines)
     
     # Highlight active canvas
     if is_active:
@@ -93,56 +254,17 @@ def scale_lines_to_image(lines_canvas, canvas_width, canvas_height, image_width,
         image_height: Height of actual image
     
     Returns:
-        Lines scaled to image coordinates
+        Lines scaled to image coordinates as a float32 array of shape (N, 2, 2),
+        indexed as [line, endpoint (P or Q), coordinate (x or y)]
     """
-    scale_x = image_width / canvas_width
-    scale_y = image_height / canvas_height
+    scale = np.array([image_width / canvas_width, image_height / canvas_height], dtype=np.float32)
     
-    lines_scaled = []
-    for (p, q) in lines_canvas:
-        p_scaled = (p[0] * scale_x, p[1] * scale_y)
-        q_scaled = (q[0] * scale_x, q[1] * scale_y)
-        lines_scaled.append((p_scaled, q_scaled))
+    # Broadcasting over the last axis scales both endpoints of every line at once
+    lines_scaled = np.asarray(lines_canvas, dtype=np.float32).reshape(-1, 2, 2) * scale
     
     return lines_scaled
 
 
-def draw_warped_grid_overlay(canvas, warped_grid_lines, canvas_width, canvas_height, image_width, image_height, color="cyan", width=1):
-    """
-    Draw warped grid lines as an overlay on the canvas.
-    
-    Args:
-        canvas: tkinter Canvas widget
-        warped_grid_lines: List of warped grid lines, each is a list of points [(x1, y1), (x2, y2), ...]
-        canvas_width: Width of canvas
-        canvas_height: Height of canvas
-        image_width: Width of actual image
-        image_height: Height of actual image
-        color: Color of grid lines (default: cyan)
-        width: Width of grid lines (default: 1)
-    """
-    # Scale factor from image coordinates to canvas coordinates
-    scale_x = canvas_width / image_width
-    scale_y = canvas_height / image_height
-    
-    # Draw each warped grid line
-    for warped_line in warped_grid_lines:
-        # Convert points to canvas coordinates and draw segments
-        for i in range(len(warped_line) - 1):
-            x1, y1 = warped_line[i]
-            x2, y2 = warped_line[i + 1]
-            
-            # Scale to canvas coordinates
-            canvas_x1 = x1 * scale_x
-            canvas_y1 = y1 * scale_y
-            canvas_x2 = x2 * scale_x
-            canvas_y2 = y2 * scale_y
-            
-            # Draw line segment
-            canvas.create_line(canvas_x1, canvas_y1, canvas_x2, canvas_y2, 
-                             fill=color, width=width, tags="grid_overlay")
-
-
 def display_image_with_grid_overlay(image, canvas, warped_grid_lines, canvas_width=400, canvas_height=300, grid_color="cyan"):
     """
     Display an image on canvas with warped grid overlay.
@@ -155,15 +277,10 @@ def display_image_with_grid_overlay(image, canvas, warped_grid_lines, canvas_wid
         canvas_height: Height of canvas
         grid_color: Color of grid lines
     """
-    # First display the image
-    display_image_on_canvas(image, canvas, canvas_width, canvas_height)
-    
-    # Then draw grid overlay
-    if warped_grid_lines and len(warped_grid_lines) > 0:
-        draw_warped_grid_overlay(canvas, warped_grid_lines, 
-                                canvas_width, canvas_height,
-                                image.size[0], image.size[1],
-                                color=grid_color, width=1)
+    # The grid is drawn into the image, so both display modes show a single
+    # PhotoImage instead of hundreds of canvas line items
+    img_resized = _image_for_canvas(image, canvas_width, canvas_height, warped_grid_lines, grid_color)
+    _replace_canvas_contents(canvas, _reusable_canvas_photo(canvas, img_resized))
 
 
 